@@ -37,14 +37,8 @@ class SynthesizerAgent:
         results = valuation_output.results
 
         # Get revenue metric
-        revenue_metric = next(
-            (m for m in financial_summary.metrics if m.metric_name == "Revenue"),
-            None,
-        )
-        operating_income_metric = next(
-            (m for m in financial_summary.metrics if m.metric_name == "Operating Income"),
-            None,
-        )
+        revenue_metric = financial_summary.get("Revenue")
+        operating_income_metric = financial_summary.get("Operating Income")
 
         # Calculate growth metrics
         growth_text = ""
@@ -189,7 +183,7 @@ Financial data extracted from SEC XBRL companyfacts API:
 ---
 
 *This memo was generated by MCP-Powered Financial Research Analyst v0.1.0*  
-*Run ID: {self.run_context.run_id[:8]}*
+*Run ID: {self.run_context.short_id}*
 """
         return memo
 
@@ -1,7 +1,8 @@
 """DCF valuation agent."""
 
 import math
-from typing import Optional
+from itertools import accumulate
+from typing import List, Optional
 
 from mcp_analyst.orchestrator.run_context import RunContext
 from mcp_analyst.schemas.factpack import FactPack
@@ -15,6 +16,21 @@ from mcp_analyst.schemas.valuation import (
 from mcp_analyst.valuation.fade import get_fade_schedule
 
 
+def _project_revenue(base: float, growth_rates: List[float]) -> List[float]:
+    """Compound base revenue through a growth schedule.
+
+    Args:
+        base: Base-year revenue
+        growth_rates: Per-year growth rates
+
+    Returns:
+        Projected revenue for each forecast year
+    """
+    projected = accumulate(growth_rates, lambda revenue, growth: revenue * (1 + growth), initial=base)
+    next(projected)  # Skip the base year itself
+    return list(projected)
+
+
 class ValuationAgent:
     """Produces DCF assumptions and valuation results."""
 
@@ -24,17 +40,16 @@ class ValuationAgent:
 
     def _get_metric(self, financial_summary: FinancialSummary, metric_name: str) -> Optional[list]:
         """Get metric values by name."""
-        for metric in financial_summary.metrics:
-            if metric.metric_name.lower() == metric_name.lower():
-                return metric.values
-        return None
+        metric = financial_summary.get(metric_name)
+        return metric.values if metric else None
 
     def _get_metric_by_period_type(
         self, financial_summary: FinancialSummary, metric_name: str, period_type: str
     ) -> Optional[MetricSeries]:
         """Get metric series filtered by period type (annual/quarterly)."""
+        name_lc = metric_name.lower()
         for metric in financial_summary.metrics:
-            if metric.metric_name.lower() == metric_name.lower():
+            if metric.name_lc == name_lc:
                 # Filter periods
                 filtered_values = []
                 filtered_periods = []
@@ -349,29 +364,40 @@ class ValuationAgent:
         operating_forecast = []
         present_values = {}
         cumulative_pv = 0.0
-        projected_revenue = base_revenue
         prev_nwc = base_revenue * nwc_pct_rev  # Starting NWC
-
-        for year_idx, year in enumerate(forecast_years):
-            # Project revenue
-            growth_rate = revenue_growth_rates[year_idx]
-            projected_revenue = projected_revenue * (1 + growth_rate)
-
+        projected_revenues = _project_revenue(base_revenue, revenue_growth_rates[:len(forecast_years)])
+
+        # Walk the per-year driver columns of the assumptions side by side, so the
+        # forecast uses exactly the vectors exported to the Inputs sheet
+        drivers = zip(
+            forecast_years,
+            projected_revenues,
+            assumptions.cogs_ex_da_pct_rev,
+            assumptions.sga_pct_rev,
+            assumptions.da_pct_rev,
+            assumptions.sbc_pct_rev,
+            assumptions.capex_pct_rev,
+            assumptions.nwc_pct_rev,
+        )
+        for year_idx, (
+            year, projected_revenue, year_cogs_pct, year_sga_pct, year_da_pct,
+            year_sbc_pct, year_capex_pct, year_nwc_pct,
+        ) in enumerate(drivers):
             # Operating build
-            cogs_ex_da = projected_revenue * cogs_pct
-            sga = projected_revenue * sga_pct
-            da = projected_revenue * da_pct
+            cogs_ex_da = projected_revenue * year_cogs_pct
+            sga = projected_revenue * year_sga_pct
+            da = projected_revenue * year_da_pct
             ebit = projected_revenue - cogs_ex_da - sga - da
             taxes = ebit * assumptions.tax_rate
             nopat = ebit - taxes
 
             # Add-backs
             da_addback = da
-            sbc_addback = projected_revenue * sbc_pct
+            sbc_addback = projected_revenue * year_sbc_pct
 
             # Investments
-            capex = projected_revenue * capex_pct_rev
-            current_nwc = projected_revenue * nwc_pct_rev
+            capex = projected_revenue * year_capex_pct
+            current_nwc = projected_revenue * year_nwc_pct
             delta_nwc = current_nwc - prev_nwc
             prev_nwc = current_nwc
 
@@ -454,15 +480,16 @@ class ValuationAgent:
         ]
 
         final_ufcf = operating_forecast[-1].unlevered_fcf
+        cumulative_pv = sum(f.pv_ufcf for f in operating_forecast)
         sensitivity_table = {}
 
         for wacc in wacc_range:
             row = {}
-            cumulative_pv = sum(f.pv_ufcf for f in operating_forecast)
+            terminal_discount = (1 + wacc) ** horizon_years  # Same for every growth rate
             for growth in growth_range:
                 terminal_ufcf = final_ufcf * (1 + growth)
                 terminal_value = terminal_ufcf / (wacc - growth) if wacc > growth else 0
-                pv_terminal = terminal_value / ((1 + wacc) ** horizon_years)
+                pv_terminal = terminal_value / terminal_discount
                 total_ev = cumulative_pv + pv_terminal
                 equity_value = total_ev - net_debt
                 price_per_share = equity_value / shares_out if shares_out > 0 else 0.0
@@ -31,6 +31,8 @@ class Config:
     REQUEST_DELAY_SECONDS: float = 0.1  # Rate limiting
     REQUEST_TIMEOUT_SECONDS: int = 30
     MAX_RETRIES: int = 3
+    # Skip the slow yfinance .info request when it would only supply beta
+    QUOTE_SKIP_BETA: bool = os.getenv("QUOTE_SKIP_BETA", "").lower() in ("1", "true", "yes")
 
     # Analysis Defaults
     DEFAULT_HORIZON: str = "5y"
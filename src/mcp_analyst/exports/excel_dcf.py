@@ -1,7 +1,8 @@
 """Excel DCF workbook export using openpyxl - Analyst-style DCF model."""
 
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, overload
 
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill
@@ -9,13 +10,14 @@ from openpyxl.utils import get_column_letter
 
 from mcp_analyst.exports.excel_styles import (
     apply_currency_millions,
-    apply_decimal,
+    apply_formats,
     apply_header,
     apply_input,
     apply_number,
     apply_percent,
     apply_section_header,
     freeze_panes,
+    register_styles,
     set_column_widths,
     to_millions,
 )
@@ -27,27 +29,69 @@ from mcp_analyst.schemas.valuation import ValuationOutput
 from mcp_analyst.tools.pricing import fetch_quote
 
 
+class ValSumLayout:
+    """
+    Fixed ValSum cell coordinates for readers of the exported workbook.
+
+    Everything above the Price Comparison section has a constant height, so these
+    cells do not move with the inputs; keep them in sync with _write_valsum.
+    """
+
+    CURRENT_PRICE_LABEL = "A13"
+    CURRENT_PRICE_VALUE = "B13"
+
+
+@overload
+def export_dcf_to_excel(
+    valuation_output: ValuationOutput,
+    run_context: RunContext,
+    financial_summary: Optional[FinancialSummary] = ...,
+    quote_data: Optional[QuoteData] = ...,
+    factpack: Optional[FactPack] = ...,
+    out: None = ...,
+) -> Path: ...
+
+
+@overload
+def export_dcf_to_excel(
+    valuation_output: ValuationOutput,
+    run_context: RunContext,
+    financial_summary: Optional[FinancialSummary] = ...,
+    quote_data: Optional[QuoteData] = ...,
+    factpack: Optional[FactPack] = ...,
+    *,
+    out: BinaryIO,
+) -> None: ...
+
+
 def export_dcf_to_excel(
     valuation_output: ValuationOutput,
     run_context: RunContext,
     financial_summary: Optional[FinancialSummary] = None,
     quote_data: Optional[QuoteData] = None,
     factpack: Optional[FactPack] = None,
-) -> Path:
+    out: Optional[BinaryIO] = None,
+) -> Optional[Path]:
     """
     Export DCF assumptions and results to Excel workbook (analyst-style).
 
     Args:
         valuation_output: Valuation output with assumptions and results
         run_context: Run context for file naming
+        out: Optional binary stream to write the workbook to (e.g. an HTTP
+            response) instead of a file in the run directory
 
     Returns:
-        Path to created Excel file
+        Path to created Excel file, or None when written to ``out``
     """
     wb = Workbook()
     wb.remove(wb.active)  # Remove default sheet
+    register_styles(wb)
 
     # Sheet order: Historical, Inputs, DCF, Cases, WACC, Sensitivities, ValSum
+    # Sheets are written sequentially on purpose: every style assignment registers into
+    # workbook-wide IndexedLists (fonts, fills, number formats) with an unlocked
+    # check-then-append, and the writers are pure Python, so threads add races, not speed.
     if financial_summary:
         historical_sheet = wb.create_sheet("Historical", 0)
         _write_historical(historical_sheet, financial_summary, run_context.ticker)
@@ -77,14 +121,60 @@ def export_dcf_to_excel(
     _write_valsum(valsum_sheet, valuation_output, run_context.ticker, quote_data, factpack)
 
     # Save workbook
+    if out is not None:
+        wb.save(out)
+        return None
+
     date_str = run_context.created_at.strftime("%Y-%m-%d")
     filename = f"DCF_{run_context.ticker}_{date_str}.xlsx"
     excel_path = run_context.run_dir / filename
-    wb.save(excel_path)
+    with open(excel_path, "wb", buffering=1 << 20) as fh:
+        wb.save(fh)
 
     return excel_path
 
 
+_FORECAST_FIELDS = (
+    "revenue",
+    "cogs_ex_da",
+    "sga",
+    "da",
+    "ebit",
+    "taxes",
+    "nopat",
+    "da_addback",
+    "sbc_addback",
+    "delta_nwc",
+    "capex",
+    "unlevered_fcf",
+    "discount_factor",
+    "pv_ufcf",
+)
+_forecast_getter = attrgetter(*_FORECAST_FIELDS)
+
+_CONFIDENCE_FILL_COLORS = {"HIGH": "FFC6EFCE", "MED": "FFFFEB9C", "LOW": "FFFFC7CE"}
+
+
+def _forecast_columns(forecast) -> list:
+    """Pivot OperatingForecast rows into one tuple per field (same order as _FORECAST_FIELDS)."""
+    if not forecast:
+        return [()] * len(_FORECAST_FIELDS)
+    return list(zip(*map(_forecast_getter, forecast)))
+
+
+def _write_forecast_row(sheet, row: int, label: str, values, base_value=None) -> None:
+    """Write a DCF row: label in column A, base year in B, forecast years from C.
+
+    Cells without a value (e.g. the base year of derived rows) are not created at all,
+    so they don't add empty ``<c/>`` elements to the sheet XML.
+    """
+    sheet.cell(row, 1).value = label
+    if base_value is not None:
+        sheet.cell(row, 2).value = base_value
+    for col_idx, value in enumerate(values, start=3):
+        sheet.cell(row, col_idx).value = value
+
+
 def _add_title_block(sheet, ticker: str, title: str, row: int = 1) -> int:
     """Add title block to sheet. Returns next row number."""
     sheet.cell(row, 1).value = f"{ticker} - {title}"
@@ -171,9 +261,9 @@ def _write_overview_block(sheet, valuation_output: ValuationOutput, quote_data:
         sheet.cell(row, 2).value = upside
         apply_percent(sheet, f"B{row}")
         if upside > 0:
-            sheet.cell(row, 2).font = Font(bold=True, color="006100")  # Green
+            sheet.cell(row, 2).font = Font(bold=True, color="FF006100")  # Green
         else:
-            sheet.cell(row, 2).font = Font(bold=True, color="C00000")  # Red
+            sheet.cell(row, 2).font = Font(bold=True, color="FFC00000")  # Red
     else:
         sheet.cell(row, 2).value = "N/A"
     row += 1
@@ -247,14 +337,17 @@ def _write_inputs(sheet, assumptions, ticker: str) -> None:
     sheet.cell(row, 3).value = "Confidence"
     apply_header(sheet, f"A{row}:C{row}")
 
-    row += 1
-    input_start_row = row
+    input_start_row = row + 1
 
     # Helper to get confidence
     def get_conf(key: str) -> str:
         return assumptions.confidence.get(key, "LOW") if assumptions.confidence else "LOW"
 
-    inputs = [
+    def first(values: list) -> float:
+        return values[0] if values else 0
+
+    # (label, value, format, confidence); format "section" marks a bold sub-heading
+    rows = [
         ("Base Year", assumptions.base_year, None, None),
         ("Base Revenue ($M)", to_millions(assumptions.base_year_revenue), "currency", get_conf("base_revenue")),
         ("Horizon (years)", assumptions.horizon_years, None, None),
@@ -264,81 +357,53 @@ def _write_inputs(sheet, assumptions, ticker: str) -> None:
         ("Terminal Method", assumptions.terminal_method, None, None),
         ("Shares Outstanding (M)", to_millions(assumptions.shares_out), None, get_conf("shares_out")),
         ("Net Debt ($M)", to_millions(assumptions.net_debt), "currency", get_conf("net_debt")),
+        # Revenue growth rates
+        (
+            "Revenue Growth Rates",
+            f"Fade: {assumptions.fade_method}" if assumptions.fade_method else None,
+            "section",
+            None,
+        ),
     ]
-
-    for label, value, fmt_type, conf in inputs:
+    growth_conf = get_conf("revenue_growth")
+    rows.extend(
+        (f"Year {i+1}", rate, "percent", growth_conf)
+        for i, rate in enumerate(assumptions.revenue_growth_rates)
+    )
+    # Cost structure assumptions
+    rows.extend([
+        ("Cost Structure (% of Revenue)", None, "section", None),
+        ("COGS ex D&A", first(assumptions.cogs_ex_da_pct_rev), "percent", get_conf("cogs_pct")),
+        ("SG&A", first(assumptions.sga_pct_rev), "percent", get_conf("sga_pct")),
+        ("D&A", first(assumptions.da_pct_rev), "percent", get_conf("da_pct")),
+        ("SBC", first(assumptions.sbc_pct_rev), "percent", get_conf("sbc_pct")),
+        ("Capex", first(assumptions.capex_pct_rev), "percent", get_conf("capex_pct")),
+        ("NWC", first(assumptions.nwc_pct_rev), "percent", get_conf("nwc_pct")),
+    ])
+
+    for row, (label, value, fmt_type, conf) in enumerate(rows, start=input_start_row):
         sheet.cell(row, 1).value = label
+        if fmt_type == "section":
+            sheet.cell(row, 1).font = Font(bold=True)
+            if value:
+                sheet.cell(row, 2).value = value
+                sheet.cell(row, 2).font = Font(italic=True, size=9)
+            continue
+
         sheet.cell(row, 2).value = value
         if fmt_type == "currency":
             apply_currency_millions(sheet, f"B{row}")
         elif fmt_type == "percent":
             apply_percent(sheet, f"B{row}")
-        
-        # Confidence column
+
+        # Confidence column, color coded: HIGH=green, MED=yellow, LOW=red
         if conf:
             sheet.cell(row, 3).value = conf
-            # Color code: HIGH=green, MED=yellow, LOW=red
-            if conf == "HIGH":
-                sheet.cell(row, 3).fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            elif conf == "MED":
-                sheet.cell(row, 3).fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-            else:  # LOW
-                sheet.cell(row, 3).fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        row += 1
-
-    # Revenue growth rates
-    sheet.cell(row, 1).value = "Revenue Growth Rates"
-    sheet.cell(row, 1).font = Font(bold=True)
-    if assumptions.fade_method:
-        sheet.cell(row, 2).value = f"Fade: {assumptions.fade_method}"
-        sheet.cell(row, 2).font = Font(italic=True, size=9)
-    row += 1
-    growth_conf = get_conf("revenue_growth")
-    for i, rate in enumerate(assumptions.revenue_growth_rates):
-        sheet.cell(row, 1).value = f"Year {i+1}"
-        sheet.cell(row, 2).value = rate
-        apply_percent(sheet, f"B{row}")
-        sheet.cell(row, 3).value = growth_conf
-        # Apply same color as above
-        if growth_conf == "HIGH":
-            sheet.cell(row, 3).fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        elif growth_conf == "MED":
-            sheet.cell(row, 3).fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-        else:
-            sheet.cell(row, 3).fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        row += 1
-
-    # Cost structure assumptions
-    sheet.cell(row, 1).value = "Cost Structure (% of Revenue)"
-    sheet.cell(row, 1).font = Font(bold=True)
-    row += 1
-    
-    cost_inputs = [
-        ("COGS ex D&A", assumptions.cogs_ex_da_pct_rev[0] if assumptions.cogs_ex_da_pct_rev else 0, "percent", get_conf("cogs_pct")),
-        ("SG&A", assumptions.sga_pct_rev[0] if assumptions.sga_pct_rev else 0, "percent", get_conf("sga_pct")),
-        ("D&A", assumptions.da_pct_rev[0] if assumptions.da_pct_rev else 0, "percent", get_conf("da_pct")),
-        ("SBC", assumptions.sbc_pct_rev[0] if assumptions.sbc_pct_rev else 0, "percent", get_conf("sbc_pct")),
-        ("Capex", assumptions.capex_pct_rev[0] if assumptions.capex_pct_rev else 0, "percent", get_conf("capex_pct")),
-        ("NWC", assumptions.nwc_pct_rev[0] if assumptions.nwc_pct_rev else 0, "percent", get_conf("nwc_pct")),
-    ]
-    
-    for label, value, fmt_type, conf in cost_inputs:
-        sheet.cell(row, 1).value = label
-        sheet.cell(row, 2).value = value
-        if fmt_type == "percent":
-            apply_percent(sheet, f"B{row}")
-        sheet.cell(row, 3).value = conf
-        # Color code
-        if conf == "HIGH":
-            sheet.cell(row, 3).fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        elif conf == "MED":
-            sheet.cell(row, 3).fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-        else:
-            sheet.cell(row, 3).fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        row += 1
+            fill_color = _CONFIDENCE_FILL_COLORS.get(conf, _CONFIDENCE_FILL_COLORS["LOW"])
+            sheet.cell(row, 3).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
 
     # Apply input styling
-    apply_input(sheet, f"A{input_start_row}:B{row-1}")
+    apply_input(sheet, f"A{input_start_row}:B{input_start_row + len(rows) - 1}")
 
     # Set column widths
     set_column_widths(sheet, {1: 30, 2: 15, 3: 12})
@@ -359,6 +424,8 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
     header_row = row
     num_cols = len(headers)
     last_col_letter = get_column_letter(num_cols)
+    # Rows without a terminal value are only formatted up to the last forecast year
+    last_fcst_letter = get_column_letter(num_cols - 1)
 
     for col, header in enumerate(headers, start=1):
         cell = sheet.cell(header_row, col)
@@ -373,83 +440,53 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
     apply_section_header(sheet, f"A{data_start_row}:{last_col_letter}{data_start_row}")
     data_start_row += 1
     
-    # Operating rows - write directly from forecast data
+    # Operating rows - pivot the forecast into per-field columns in a single pass
+    (
+        revenues, cogs, sgas, das, ebits, taxes, nopats, da_addbacks,
+        sbc_addbacks, delta_nwcs, capexes, ufcfs, discount_factors, pv_ufcfs,
+    ) = _forecast_columns(forecast[:len(assumptions.forecast_years)])
+
     revenue_row = data_start_row
-    sheet.cell(revenue_row, 1).value = "Revenue"
-    sheet.cell(revenue_row, 2).value = to_millions(assumptions.base_year_revenue)
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(revenue_row, col_idx).value = to_millions(f.revenue)
-    
+    base_revenue_m = to_millions(assumptions.base_year_revenue)
+    revenues_m = [to_millions(v) for v in revenues]
+    _write_forecast_row(sheet, revenue_row, "Revenue", revenues_m, base_value=base_revenue_m)
+
     cogs_row = revenue_row + 1
-    sheet.cell(cogs_row, 1).value = "(-) COGS ex D&A"
-    sheet.cell(cogs_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(cogs_row, col_idx).value = -to_millions(f.cogs_ex_da)
-    
+    cogs_m = [-to_millions(v) for v in cogs]
+    _write_forecast_row(sheet, cogs_row, "(-) COGS ex D&A", cogs_m)
+
     sga_row = cogs_row + 1
-    sheet.cell(sga_row, 1).value = "(-) SG&A"
-    sheet.cell(sga_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(sga_row, col_idx).value = -to_millions(f.sga)
-    
+    _write_forecast_row(sheet, sga_row, "(-) SG&A", [-to_millions(v) for v in sgas])
+
     da_row = sga_row + 1
-    sheet.cell(da_row, 1).value = "(-) D&A"
-    sheet.cell(da_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(da_row, col_idx).value = -to_millions(f.da)
-    
+    _write_forecast_row(sheet, da_row, "(-) D&A", [-to_millions(v) for v in das])
+
     ebit_row = da_row + 1
-    sheet.cell(ebit_row, 1).value = "EBIT"
-    sheet.cell(ebit_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(ebit_row, col_idx).value = to_millions(f.ebit)
-    
+    ebits_m = [to_millions(v) for v in ebits]
+    _write_forecast_row(sheet, ebit_row, "EBIT", ebits_m)
+
     taxes_row = ebit_row + 1
-    sheet.cell(taxes_row, 1).value = "(-) Taxes"
-    sheet.cell(taxes_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(taxes_row, col_idx).value = -to_millions(f.taxes)
-    
+    _write_forecast_row(sheet, taxes_row, "(-) Taxes", [-to_millions(v) for v in taxes])
+
     nopat_row = taxes_row + 1
-    sheet.cell(nopat_row, 1).value = "NOPAT"
-    sheet.cell(nopat_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(nopat_row, col_idx).value = to_millions(f.nopat)
-    
-    # Add margin % rows
+    _write_forecast_row(sheet, nopat_row, "NOPAT", [to_millions(v) for v in nopats])
+    
+    # Add margin % rows (forecast years only; blank where revenue is zero)
     gross_margin_row = nopat_row + 1
-    sheet.cell(gross_margin_row, 1).value = "Gross Margin %"
-    for col_idx in range(2, num_cols + 1):
-        revenue_cell = sheet.cell(revenue_row, col_idx)
-        cogs_cell = sheet.cell(cogs_row, col_idx)
-        if revenue_cell.value and revenue_cell.value != 0:
-            margin = (revenue_cell.value + cogs_cell.value) / revenue_cell.value
-            sheet.cell(gross_margin_row, col_idx).value = margin
-    apply_percent(sheet, f"B{gross_margin_row}:{last_col_letter}{gross_margin_row}")
+    _write_forecast_row(
+        sheet,
+        gross_margin_row,
+        "Gross Margin %",
+        [(rev + cost) / rev if rev else None for rev, cost in zip(revenues_m, cogs_m)],
+    )
     
     ebit_margin_row = gross_margin_row + 1
-    sheet.cell(ebit_margin_row, 1).value = "EBIT Margin %"
-    for col_idx in range(2, num_cols + 1):
-        revenue_cell = sheet.cell(revenue_row, col_idx)
-        ebit_cell = sheet.cell(ebit_row, col_idx)
-        if revenue_cell.value and revenue_cell.value != 0:
-            margin = ebit_cell.value / revenue_cell.value
-            sheet.cell(ebit_margin_row, col_idx).value = margin
-    apply_percent(sheet, f"B{ebit_margin_row}:{last_col_letter}{ebit_margin_row}")
+    _write_forecast_row(
+        sheet,
+        ebit_margin_row,
+        "EBIT Margin %",
+        [ebit / rev if rev else None for rev, ebit in zip(revenues_m, ebits_m)],
+    )
     
     op_end_row = ebit_margin_row
     data_start_row = op_end_row + 2
@@ -462,46 +499,23 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
     
     # Cash flow adjustment rows
     da_addback_row = data_start_row
-    sheet.cell(da_addback_row, 1).value = "(+) D&A add-back"
-    sheet.cell(da_addback_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(da_addback_row, col_idx).value = to_millions(f.da_addback)
-    
+    _write_forecast_row(sheet, da_addback_row, "(+) D&A add-back",
+                        [to_millions(v) for v in da_addbacks])
+
     sbc_addback_row = da_addback_row + 1
-    sheet.cell(sbc_addback_row, 1).value = "(+) SBC add-back"
-    sheet.cell(sbc_addback_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(sbc_addback_row, col_idx).value = to_millions(f.sbc_addback)
-    
+    _write_forecast_row(sheet, sbc_addback_row, "(+) SBC add-back",
+                        [to_millions(v) for v in sbc_addbacks])
+
     nwc_row = sbc_addback_row + 1
-    sheet.cell(nwc_row, 1).value = "(-) ΔNWC"
-    sheet.cell(nwc_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(nwc_row, col_idx).value = -to_millions(f.delta_nwc)
-    
+    _write_forecast_row(sheet, nwc_row, "(-) ΔNWC", [-to_millions(v) for v in delta_nwcs])
+
     capex_row = nwc_row + 1
-    sheet.cell(capex_row, 1).value = "(-) Capex"
-    sheet.cell(capex_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(capex_row, col_idx).value = -to_millions(f.capex)
-    
+    _write_forecast_row(sheet, capex_row, "(-) Capex", [-to_millions(v) for v in capexes])
+
     # Unlevered FCF - use actual forecast data
     ufcf_row = capex_row + 1
-    sheet.cell(ufcf_row, 1).value = "Unlevered FCF"
+    _write_forecast_row(sheet, ufcf_row, "Unlevered FCF", [to_millions(v) for v in ufcfs])
     sheet.cell(ufcf_row, 1).font = Font(bold=True)
-    sheet.cell(ufcf_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(ufcf_row, col_idx).value = to_millions(f.unlevered_fcf)
     
     data_start_row = ufcf_row + 2
     
@@ -513,13 +527,7 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
     
     # Discount factor row
     disc_row = data_start_row
-    sheet.cell(disc_row, 1).value = "Discount Factor"
-    sheet.cell(disc_row, 2).value = 1.0  # Base year
-    
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(disc_row, col_idx).value = f.discount_factor
+    _write_forecast_row(sheet, disc_row, "Discount Factor", discount_factors, base_value=1.0)
     
     # Terminal discount factor
     terminal_disc = (1 + assumptions.wacc) ** (-assumptions.horizon_years)
@@ -527,12 +535,7 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
     
     # PV of UFCF row - use actual forecast data
     pv_row = disc_row + 1
-    sheet.cell(pv_row, 1).value = "PV of UFCF"
-    sheet.cell(pv_row, 2).value = 0
-    for col_idx, year in enumerate(assumptions.forecast_years, start=3):
-        if col_idx - 3 < len(forecast):
-            f = forecast[col_idx - 3]
-            sheet.cell(pv_row, col_idx).value = to_millions(f.pv_ufcf)
+    _write_forecast_row(sheet, pv_row, "PV of UFCF", [to_millions(v) for v in pv_ufcfs])
     
     # Terminal value rows
     term_row = pv_row + 1
@@ -544,22 +547,26 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
     sheet.cell(pv_term_row, num_cols).value = to_millions(valuation_output.results.pv_terminal_value)
     
     # Apply formatting by row groups
-    # Operating build: currency (Revenue through NOPAT)
-    apply_currency_millions(sheet, f"B{revenue_row}:{last_col_letter}{nopat_row}")
-    # Margin rows: percent
-    apply_percent(sheet, f"B{gross_margin_row}:{last_col_letter}{ebit_margin_row}")
-    # Cash flow: currency
-    apply_currency_millions(sheet, f"B{da_addback_row}:{last_col_letter}{ufcf_row}")
-    # Discount factor: decimal
-    apply_decimal(sheet, f"B{disc_row}:{last_col_letter}{disc_row}")
-    # PV rows: currency
-    apply_currency_millions(sheet, f"B{pv_row}:{last_col_letter}{pv_term_row}")
+    apply_formats(sheet, {
+        # Operating build: currency (Revenue through NOPAT)
+        f"B{revenue_row}": "currency_m",
+        f"C{revenue_row}:{last_fcst_letter}{nopat_row}": "currency_m",
+        # Margin rows: percent
+        f"C{gross_margin_row}:{last_fcst_letter}{ebit_margin_row}": "pct",
+        # Cash flow: currency
+        f"C{da_addback_row}:{last_fcst_letter}{ufcf_row}": "currency_m",
+        # Discount factor: decimal
+        f"B{disc_row}:{last_col_letter}{disc_row}": "decimal",
+        # PV rows: currency
+        f"C{pv_row}:{last_fcst_letter}{pv_row}": "currency_m",
+        f"{last_col_letter}{term_row}:{last_col_letter}{pv_term_row}": "currency_m",
+    })
     
     # Summary rows
     summary_row = pv_term_row + 2
     sheet.cell(summary_row, 1).value = "Total PV of UFCF"
     sheet.cell(summary_row, 1).font = Font(bold=True)
-    sheet.cell(summary_row, 2).value = to_millions(sum(f.pv_ufcf for f in forecast))
+    sheet.cell(summary_row, 2).value = to_millions(valuation_output.results.total_pv_ufcf)
     apply_currency_millions(sheet, f"B{summary_row}")
     
     sheet.cell(summary_row + 1, 1).value = "PV of Terminal Value"
@@ -601,135 +608,79 @@ def _write_dcf_forecast(sheet, valuation_output: ValuationOutput, ticker: str, q
 
 def _write_cases(sheet, assumptions) -> None:
     """Write scenario cases (Base/Bull/Bear) to sheet."""
-    row = 1
     headers = ["Case", "Growth Fade", "Steady Margin", "WACC", "Terminal Growth"]
     for col, header in enumerate(headers, start=1):
-        cell = sheet.cell(row, col)
+        cell = sheet.cell(1, col)
         cell.value = header
-    apply_header(sheet, f"A{row}:{get_column_letter(len(headers))}{row}")
-
-    # Base case
-    row = 2
-    sheet.cell(row, 1).value = "Base"
-    sheet.cell(row, 2).value = "50% fade"
-    sheet.cell(row, 3).value = (
-        assumptions.cogs_ex_da_pct_rev[0] + assumptions.sga_pct_rev[0]
-        if assumptions.cogs_ex_da_pct_rev
-        else 0.85
-    )
-    apply_percent(sheet, f"C{row}")
-    sheet.cell(row, 4).value = assumptions.wacc
-    apply_percent(sheet, f"D{row}")
-    sheet.cell(row, 5).value = assumptions.terminal_growth_rate
-    apply_percent(sheet, f"E{row}")
-
-    # Bull case
-    row = 3
-    sheet.cell(row, 1).value = "Bull"
-    sheet.cell(row, 2).value = "30% fade"
-    sheet.cell(row, 3).value = (
-        (assumptions.cogs_ex_da_pct_rev[0] + assumptions.sga_pct_rev[0] - 0.05)
-        if assumptions.cogs_ex_da_pct_rev
-        else 0.80
-    )
-    apply_percent(sheet, f"C{row}")
-    sheet.cell(row, 4).value = assumptions.wacc - 0.01
-    apply_percent(sheet, f"D{row}")
-    sheet.cell(row, 5).value = assumptions.terminal_growth_rate + 0.005
-    apply_percent(sheet, f"E{row}")
-
-    # Bear case
-    row = 4
-    sheet.cell(row, 1).value = "Bear"
-    sheet.cell(row, 2).value = "70% fade"
-    sheet.cell(row, 3).value = (
-        (assumptions.cogs_ex_da_pct_rev[0] + assumptions.sga_pct_rev[0] + 0.05)
-        if assumptions.cogs_ex_da_pct_rev
-        else 0.90
-    )
-    apply_percent(sheet, f"C{row}")
-    sheet.cell(row, 4).value = assumptions.wacc + 0.01
-    apply_percent(sheet, f"D{row}")
-    sheet.cell(row, 5).value = assumptions.terminal_growth_rate - 0.005
-    apply_percent(sheet, f"E{row}")
+    apply_header(sheet, f"A1:{get_column_letter(len(headers))}1")
 
-    set_column_widths(sheet, {1: 12, 2: 15, 3: 15, 4: 12, 5: 18})
+    if assumptions.cogs_ex_da_pct_rev:
+        steady_margin = assumptions.cogs_ex_da_pct_rev[0] + assumptions.sga_pct_rev[0]
+        margins = (steady_margin, steady_margin - 0.05, steady_margin + 0.05)
+    else:
+        margins = (0.85, 0.80, 0.90)
 
+    cases = [
+        ("Base", "50% fade", margins[0], assumptions.wacc, assumptions.terminal_growth_rate),
+        ("Bull", "30% fade", margins[1], assumptions.wacc - 0.01, assumptions.terminal_growth_rate + 0.005),
+        ("Bear", "70% fade", margins[2], assumptions.wacc + 0.01, assumptions.terminal_growth_rate - 0.005),
+    ]
+    for row, case in enumerate(cases, start=2):
+        for col, value in enumerate(case, start=1):
+            sheet.cell(row, col).value = value
 
-def _write_wacc(sheet, assumptions) -> None:
-    """Write WACC calculation to sheet."""
-    row = 1
-    sheet.cell(row, 1).value = "Component"
-    sheet.cell(row, 2).value = "Value"
-    apply_header(sheet, f"A{row}:B{row}")
+    # Steady margin, WACC and terminal growth are all rates
+    apply_percent(sheet, f"C2:E{len(cases) + 1}")
 
-    # Cost of Equity
-    row = 2
-    sheet.cell(row, 1).value = "Risk-Free Rate"
-    sheet.cell(row, 2).value = assumptions.risk_free_rate
-    apply_percent(sheet, f"B{row}")
-    row += 1
+    set_column_widths(sheet, {1: 12, 2: 15, 3: 15, 4: 12, 5: 18})
 
-    sheet.cell(row, 1).value = "Equity Risk Premium"
-    sheet.cell(row, 2).value = assumptions.equity_risk_premium
-    apply_percent(sheet, f"B{row}")
-    row += 1
 
-    sheet.cell(row, 1).value = "Beta"
-    sheet.cell(row, 2).value = assumptions.beta
-    row += 1
+def _write_wacc(sheet, assumptions) -> None:
+    """Write WACC calculation to sheet."""
+    sheet.cell(1, 1).value = "Component"
+    sheet.cell(1, 2).value = "Value"
+    apply_header(sheet, "A1:B1")
 
     cost_of_equity = assumptions.risk_free_rate + (assumptions.beta * assumptions.equity_risk_premium)
-    sheet.cell(row, 1).value = "Cost of Equity"
-    sheet.cell(row, 1).font = Font(bold=True)
-    sheet.cell(row, 2).value = cost_of_equity
-    sheet.cell(row, 2).font = Font(bold=True)
-    apply_percent(sheet, f"B{row}")
-    row += 2
-
-    # Cost of Debt
-    sheet.cell(row, 1).value = "Cost of Debt"
-    sheet.cell(row, 2).value = assumptions.cost_of_debt
-    apply_percent(sheet, f"B{row}")
-    row += 1
-
-    sheet.cell(row, 1).value = "Tax Rate"
-    sheet.cell(row, 2).value = assumptions.tax_rate
-    apply_percent(sheet, f"B{row}")
-    row += 1
-
     after_tax_cost_of_debt = assumptions.cost_of_debt * (1 - assumptions.tax_rate)
-    sheet.cell(row, 1).value = "After-Tax Cost of Debt"
-    sheet.cell(row, 2).value = after_tax_cost_of_debt
-    apply_percent(sheet, f"B{row}")
-    row += 2
-
-    # Weights
-    sheet.cell(row, 1).value = "Debt/Equity Ratio"
-    sheet.cell(row, 2).value = assumptions.debt_to_equity_ratio
-    row += 1
 
     # Calculate weights
     debt_weight = assumptions.debt_to_equity_ratio / (1 + assumptions.debt_to_equity_ratio)
     equity_weight = 1 / (1 + assumptions.debt_to_equity_ratio)
+    wacc = (equity_weight * cost_of_equity) + (debt_weight * after_tax_cost_of_debt)
 
-    sheet.cell(row, 1).value = "Debt Weight"
-    sheet.cell(row, 2).value = debt_weight
-    apply_percent(sheet, f"B{row}")
-    row += 1
-
-    sheet.cell(row, 1).value = "Equity Weight"
-    sheet.cell(row, 2).value = equity_weight
-    apply_percent(sheet, f"B{row}")
-    row += 2
+    # (label, value, is_percent, font); None is a spacer row
+    rows = [
+        # Cost of Equity
+        ("Risk-Free Rate", assumptions.risk_free_rate, True, None),
+        ("Equity Risk Premium", assumptions.equity_risk_premium, True, None),
+        ("Beta", assumptions.beta, False, None),
+        ("Cost of Equity", cost_of_equity, True, Font(bold=True)),
+        None,
+        # Cost of Debt
+        ("Cost of Debt", assumptions.cost_of_debt, True, None),
+        ("Tax Rate", assumptions.tax_rate, True, None),
+        ("After-Tax Cost of Debt", after_tax_cost_of_debt, True, None),
+        None,
+        # Weights
+        ("Debt/Equity Ratio", assumptions.debt_to_equity_ratio, False, None),
+        ("Debt Weight", debt_weight, True, None),
+        ("Equity Weight", equity_weight, True, None),
+        None,
+        ("WACC", wacc, True, Font(bold=True, size=12)),
+    ]
 
-    # WACC
-    wacc = (equity_weight * cost_of_equity) + (debt_weight * after_tax_cost_of_debt)
-    sheet.cell(row, 1).value = "WACC"
-    sheet.cell(row, 1).font = Font(bold=True, size=12)
-    sheet.cell(row, 2).value = wacc
-    sheet.cell(row, 2).font = Font(bold=True, size=12)
-    apply_percent(sheet, f"B{row}")
+    for row, entry in enumerate(rows, start=2):
+        if entry is None:
+            continue
+        label, value, is_percent, font = entry
+        sheet.cell(row, 1).value = label
+        sheet.cell(row, 2).value = value
+        if font is not None:
+            sheet.cell(row, 1).font = font
+            sheet.cell(row, 2).font = font
+        if is_percent:
+            apply_percent(sheet, f"B{row}")
 
     set_column_widths(sheet, {1: 25, 2: 15})
 
@@ -763,7 +714,8 @@ def _write_sensitivities(sheet, sensitivity: dict) -> None:
             for col_idx, growth in enumerate(growth_values, start=2):
                 growth_key = f"{growth:.3f}"
                 if growth_key in sensitivity[wacc_key]:
-                    sheet.cell(row_idx, col_idx).value = sensitivity[wacc_key][growth_key]
+                    # Grid is Dict[str, Any]; coerce Decimal/numpy scalars so cells serialize as floats
+                    sheet.cell(row_idx, col_idx).value = float(sensitivity[wacc_key][growth_key])
                     sheet.cell(row_idx, col_idx).number_format = '#,##0.00'
 
     set_column_widths(sheet, {1: 20, **{i: 12 for i in range(2, len(growth_values) + 2)}})
@@ -791,18 +743,19 @@ def _write_valsum(sheet, valuation_output: ValuationOutput, ticker: str, quote_d
         ("Fair Value per Share", results.fair_value_per_share, "per_share"),
     ]
 
-    for label, value, fmt_type in summary_data:
-        if label:  # Skip spacer
-            sheet.cell(row, 1).value = label
-            sheet.cell(row, 2).value = value
-            if fmt_type == "currency":
-                apply_currency_millions(sheet, f"B{row}")
-            elif fmt_type == "number":
-                apply_number(sheet, f"B{row}")
-            elif fmt_type == "per_share":
-                sheet.cell(row, 2).number_format = '#,##0.00'
-                sheet.cell(row, 2).font = Font(bold=True, size=12)
-        row += 1
+    for r, (label, value, fmt_type) in enumerate(summary_data, start=row):
+        if not label:  # Skip spacer
+            continue
+        sheet.cell(r, 1).value = label
+        sheet.cell(r, 2).value = value
+        if fmt_type == "currency":
+            apply_currency_millions(sheet, f"B{r}")
+        elif fmt_type == "number":
+            apply_number(sheet, f"B{r}")
+        elif fmt_type == "per_share":
+            sheet.cell(r, 2).number_format = '#,##0.00'
+            sheet.cell(r, 2).font = Font(bold=True, size=12)
+    row += len(summary_data)
 
     # Price Comparison Section
     row += 1
@@ -818,12 +771,12 @@ def _write_valsum(sheet, valuation_output: ValuationOutput, ticker: str, quote_d
     market_cap = quote_data.market_cap if quote_data else None
     beta = quote_data.beta if quote_data else None
 
-    sheet.cell(row, 1).value = "Current Price"
-    if current_price:
-        sheet.cell(row, 2).value = current_price
-    else:
-        sheet.cell(row, 2).value = "N/A"
-    sheet.cell(row, 2).number_format = '#,##0.00'
+    # Nothing above here varies in height, so this row is the one published in
+    # ValSumLayout (test_current_price_cell_is_numeric checks they stay in sync)
+    sheet.cell(row=row, column=1).value = "Current Price"
+    price_cell = sheet.cell(row=row, column=2)
+    price_cell.value = current_price if current_price else "N/A"
+    price_cell.number_format = '#,##0.00'
     row += 1
 
     if market_cap:
@@ -849,9 +802,9 @@ def _write_valsum(sheet, valuation_output: ValuationOutput, ticker: str, quote_d
         upside = (results.fair_value_per_share / current_price) - 1.0
         sheet.cell(row, 2).value = upside
         if upside > 0:
-            sheet.cell(row, 2).font = Font(bold=True, color="006100")  # Green for upside
+            sheet.cell(row, 2).font = Font(bold=True, color="FF006100")  # Green for upside
         else:
-            sheet.cell(row, 2).font = Font(bold=True, color="C00000")  # Red for downside
+            sheet.cell(row, 2).font = Font(bold=True, color="FFC00000")  # Red for downside
     else:
         sheet.cell(row, 2).value = "N/A"
     sheet.cell(row, 2).number_format = '0.0%'
@@ -870,11 +823,11 @@ def _write_valsum(sheet, valuation_output: ValuationOutput, ticker: str, quote_d
         ("Bear Case", results.fair_value_per_share * 0.8),  # Placeholder
     ]
     
-    for label, value in cases_data:
-        sheet.cell(row, 1).value = label
-        sheet.cell(row, 2).value = value
-        sheet.cell(row, 2).number_format = '#,##0.00'
-        row += 1
+    for r, (label, value) in enumerate(cases_data, start=row):
+        sheet.cell(r, 1).value = label
+        sheet.cell(r, 2).value = value
+        sheet.cell(r, 2).number_format = '#,##0.00'
+    row += len(cases_data)
 
     # Key Assumptions
     row += 1
@@ -889,14 +842,14 @@ def _write_valsum(sheet, valuation_output: ValuationOutput, ticker: str, quote_d
         ("Base Revenue ($M)", to_millions(assumptions.base_year_revenue), "currency"),
     ]
 
-    for label, value, fmt_type in assumptions_data:
-        sheet.cell(row, 1).value = label
-        sheet.cell(row, 2).value = value
+    for r, (label, value, fmt_type) in enumerate(assumptions_data, start=row):
+        sheet.cell(r, 1).value = label
+        sheet.cell(r, 2).value = value
         if fmt_type == "currency":
-            apply_currency_millions(sheet, f"B{row}")
+            apply_currency_millions(sheet, f"B{r}")
         elif fmt_type == "percent":
-            apply_percent(sheet, f"B{row}")
-        row += 1
+            apply_percent(sheet, f"B{r}")
+    row += len(assumptions_data)
 
     # Material Events Section
     if factpack and factpack.material_events:
@@ -928,11 +881,11 @@ def _write_valsum(sheet, valuation_output: ValuationOutput, ticker: str, quote_d
             # Sentiment with color
             sheet.cell(row, 3).value = event.sentiment.title()
             if event.sentiment == "positive":
-                sheet.cell(row, 3).fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+                sheet.cell(row, 3).fill = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")
             elif event.sentiment == "negative":
-                sheet.cell(row, 3).fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                sheet.cell(row, 3).fill = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
             else:
-                sheet.cell(row, 3).fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+                sheet.cell(row, 3).fill = PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid")
             
             # Category
             sheet.cell(row, 4).value = event.category.replace("_", " ").title()
@@ -4,146 +4,214 @@ from openpyxl.styles import (
     Alignment,
     Border,
     Font,
+    NamedStyle,
     PatternFill,
     Side,
 )
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import get_column_letter, range_boundaries
+
+# Style objects are immutable once assigned to a cell, so build them once at import
+# and share them across every apply_* call instead of re-allocating per call.
+# Colors are full ARGB: a 6-char code is stored with alpha 00 (transparent).
+_BLACK = "FF000000"
+_WHITE = "FFFFFFFF"
+_HEADER_FG = "FF366092"
+_INPUT_FG = "FFFFF2CC"
+_SECTION_HEADER_FG = "FF1F4E78"
+
+_SIDE_THIN = Side(style="thin")
+_SIDE_MEDIUM = Side(style="medium")
+_SIDE_THIN_BLACK = Side(style="thin", color=_BLACK)
+_SIDE_MEDIUM_BLACK = Side(style="medium", color=_BLACK)
+
+_HEADER_STYLE = {
+    "font": Font(bold=True, color=_WHITE, size=11),
+    "fill": PatternFill(start_color=_HEADER_FG, end_color=_HEADER_FG, fill_type="solid"),
+    "alignment": Alignment(horizontal="center", vertical="center", wrap_text=True),
+    "border": Border(
+        left=_SIDE_THIN_BLACK,
+        right=_SIDE_THIN_BLACK,
+        top=_SIDE_THIN_BLACK,
+        bottom=_SIDE_MEDIUM_BLACK,
+    ),
+}
+
+_INPUT_STYLE = {
+    "fill": PatternFill(start_color=_INPUT_FG, end_color=_INPUT_FG, fill_type="solid"),
+    "border": Border(left=_SIDE_THIN, right=_SIDE_THIN, top=_SIDE_THIN, bottom=_SIDE_THIN),
+}
+
+_SECTION_HEADER_STYLE = {
+    "font": Font(bold=True, color=_WHITE, size=11),
+    "fill": PatternFill(start_color=_SECTION_HEADER_FG, end_color=_SECTION_HEADER_FG, fill_type="solid"),
+    "alignment": Alignment(horizontal="left", vertical="center"),
+    "border": Border(left=_SIDE_THIN, right=_SIDE_THIN, top=_SIDE_MEDIUM, bottom=_SIDE_THIN),
+}
+
+
+# Header and section-header cells take the whole style, so they are registered as
+# workbook NamedStyles and assigned by name (one xf per cell). Input and number-format
+# helpers only overlay attributes on cells that may already carry a font or format,
+# which a NamedStyle assignment would reset, so they keep per-attribute assignment.
+HEADER_STYLE_NAME = "mcp_header"
+SECTION_HEADER_STYLE_NAME = "mcp_section_header"
+
+_NAMED_STYLES = {
+    HEADER_STYLE_NAME: _HEADER_STYLE,
+    SECTION_HEADER_STYLE_NAME: _SECTION_HEADER_STYLE,
+}
+
+
+def register_styles(workbook):
+    """Register the shared named styles on a workbook (idempotent).
+
+    NamedStyle objects are bound to a single workbook, so a fresh one is built
+    for each workbook rather than shared at module level.
+
+    Args:
+        workbook: openpyxl Workbook to register the styles on
+    """
+    registered = workbook.named_styles
+    for name, style in _NAMED_STYLES.items():
+        if name not in registered:
+            workbook.add_named_style(NamedStyle(name=name, **style))
 
 
 def header_style():
-    """Get header cell style."""
-    return {
-        "font": Font(bold=True, color="FFFFFF", size=11),
-        "fill": PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
-        "alignment": Alignment(horizontal="center", vertical="center", wrap_text=True),
-        "border": Border(
-            left=Side(style="thin", color="000000"),
-            right=Side(style="thin", color="000000"),
-            top=Side(style="thin", color="000000"),
-            bottom=Side(style="medium", color="000000"),
-        ),
-    }
+    """Get header cell style (shared, do not mutate)."""
+    return _HEADER_STYLE
 
 
 def input_style():
-    """Get input cell style."""
-    return {
-        "fill": PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"),
-        "border": Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        ),
-    }
+    """Get input cell style (shared, do not mutate)."""
+    return _INPUT_STYLE
+
+
+# Number formats by key, for batch application via apply_formats()
+FORMATS = {
+    "currency_m": '$#,##0',
+    "pct": '0.0%',
+    "per_share": '#,##0.00',
+    "number": '#,##0',
+    "decimal": '0.000',
+}
 
 
 def currency_millions_format():
     """Get currency format for $ Millions."""
-    return '$#,##0'  # $43,978
+    return FORMATS["currency_m"]  # $43,978
 
 
 def percent_format():
     """Get percent format."""
-    return '0.0%'  # 15.2%
+    return FORMATS["pct"]  # 15.2%
 
 
 def per_share_format():
     """Get per-share format."""
-    return '#,##0.00'  # 45.23
+    return FORMATS["per_share"]  # 45.23
 
 
 def apply_header(sheet, cell_range):
     """Apply header style to cell range."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
-    style = header_style()
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
-            for key, value in style.items():
-                setattr(cell, key, value)
+    register_styles(sheet.parent)
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
+            cell.style = HEADER_STYLE_NAME
 
 
 def apply_input(sheet, cell_range):
     """Apply input style to cell range."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
-    style = input_style()
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
-            for key, value in style.items():
-                setattr(cell, key, value)
+    style = _INPUT_STYLE
+    fill, border = style["fill"], style["border"]
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
+            cell.fill = fill
+            cell.border = border
 
 
 def apply_currency_millions(sheet, cell_range):
     """Apply $ Millions format to cell range."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
     fmt = currency_millions_format()
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
             cell.number_format = fmt
 
 
 def apply_percent(sheet, cell_range):
     """Apply percent format to cell range."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
     fmt = percent_format()
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
             cell.number_format = fmt
 
 
 def apply_number(sheet, cell_range, fmt='#,##0'):
     """Apply number format to cell range (for shares, counts, etc.)."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
             cell.number_format = fmt
 
 
 def apply_decimal(sheet, cell_range, fmt='0.000'):
     """Apply decimal format to cell range (for discount factors, etc.)."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
             cell.number_format = fmt
 
 
+def apply_formats(sheet, spec: dict):
+    """Apply number formats to several ranges in one pass.
+
+    Ranges are applied in insertion order, so a later range overrides an earlier
+    one where they overlap.
+
+    Args:
+        sheet: Worksheet to format
+        spec: Dict mapping cell ranges (e.g. "C5:G9") to FORMATS keys
+    """
+    for cell_range, fmt_key in spec.items():
+        fmt = FORMATS[fmt_key]
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        for row in sheet.iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+        ):
+            for cell in row:
+                cell.number_format = fmt
+
+
 def section_header_style():
-    """Get section header style (dark fill, white font, merged)."""
-    return {
-        "font": Font(bold=True, color="FFFFFF", size=11),
-        "fill": PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid"),
-        "alignment": Alignment(horizontal="left", vertical="center"),
-        "border": Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="medium"),
-            bottom=Side(style="thin"),
-        ),
-    }
+    """Get section header style (dark fill, white font, merged; shared, do not mutate)."""
+    return _SECTION_HEADER_STYLE
 
 
 def apply_section_header(sheet, cell_range):
     """Apply section header style to cell range."""
-    from openpyxl.utils import range_boundaries
     min_col, min_row, max_col, max_row = range_boundaries(cell_range)
-    style = section_header_style()
-    for row in range(min_row, max_row + 1):
-        for col in range(min_col, max_col + 1):
-            cell = sheet.cell(row, col)
-            for key, value in style.items():
-                setattr(cell, key, value)
+    register_styles(sheet.parent)
+    for row in sheet.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+    ):
+        for cell in row:
+            cell.style = SECTION_HEADER_STYLE_NAME
 
 
 def set_column_widths(sheet, widths: dict):
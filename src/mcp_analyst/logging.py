@@ -1,30 +1,71 @@
 """Structured logging configuration."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+_LOG_BUFFER_SIZE = 64 * 1024
+
+_LOGGER_NAME = "mcp_analyst"
+
+_LISTENER: Optional[QueueListener] = None
+_QUEUE_HANDLER: Optional[QueueHandler] = None
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer instead of flushing every record.
+
+    The buffer is flushed when full, on ERROR and above (so failures reach disk
+    even if the process dies), and when the handler is closed.
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(
     run_dir: Optional[Path] = None,
     log_level: int = logging.INFO,
 ) -> logging.Logger:
-    """Setup structured logging with file and console handlers."""
-    logger = logging.getLogger("mcp_analyst")
+    """Setup structured logging with file and console handlers.
+
+    Records are put on an in-memory queue and written to the console and log
+    file by a background listener thread, so callers never block on I/O.
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
     logger.setLevel(log_level)
 
-    # Clear existing handlers
+    # Clear existing handlers (and flush/close those of a previous setup)
+    stop_logging()
     logger.handlers.clear()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_FORMATTER)
+    handlers: List[logging.Handler] = [console_handler]
 
     # File handler (if run_dir provided)
     if run_dir:
@@ -32,13 +73,37 @@ def setup_logging(
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "pipeline.log"
 
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BufferedFileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(log_level)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
+
+    global _LISTENER, _QUEUE_HANDLER
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _QUEUE_HANDLER = QueueHandler(log_queue)
+    logger.addHandler(_QUEUE_HANDLER)
+    _LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
 
     return logger
 
+
+def stop_logging() -> None:
+    """Flush queued records and close the handlers behind the queue (idempotent).
+
+    The queue handler is detached first, so records logged afterwards are not
+    left in a queue that nothing reads.
+    """
+    global _LISTENER, _QUEUE_HANDLER
+    if _QUEUE_HANDLER is not None:
+        logging.getLogger(_LOGGER_NAME).removeHandler(_QUEUE_HANDLER)
+        _QUEUE_HANDLER = None
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
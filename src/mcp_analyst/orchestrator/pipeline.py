@@ -1,16 +1,12 @@
 """End-to-end pipeline execution."""
 
-from mcp_analyst.agents.financials import FinancialsAgent
-from mcp_analyst.agents.retriever import RetrieverAgent
-from mcp_analyst.agents.skeptic import SkepticAgent
-from mcp_analyst.agents.synthesizer import SynthesizerAgent
-from mcp_analyst.agents.valuation import ValuationAgent
-from mcp_analyst.exports.excel_dcf import export_dcf_to_excel
-from mcp_analyst.logging import setup_logging
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from mcp_analyst.logging import setup_logging, stop_logging
 from mcp_analyst.orchestrator.run_context import RunContext
 from mcp_analyst.storage.artifacts import save_artifacts, save_failed_run
 from mcp_analyst.storage.runs import create_run_directory
-from mcp_analyst.tools.pricing import fetch_quote
 
 
 class Pipeline:
@@ -19,7 +15,7 @@ class Pipeline:
     def __init__(self, run_context: RunContext):
         """Initialize pipeline with run context."""
         self.run_context = run_context
-        self.logger = setup_logging(run_dir=run_context.run_dir)
+        self.logger = logging.getLogger("mcp_analyst")
 
     def _validate_retriever(self, factpack) -> None:
         """Validate retriever output."""
@@ -54,11 +50,21 @@ class Pipeline:
                 f"Need at least 4 quarters for TTM calculation."
             )
 
+        # Classify metric families in a single pass instead of one scan per check
+        has_operating_income = has_cfo = has_capex = has_shares = False
+        for m in financial_summary.metrics:
+            name = m.name_lc
+            if "operating" in name and "income" in name:
+                has_operating_income = True
+            if "cfo" in name or "cash flow" in name:
+                has_cfo = True
+            if "capex" in name or "capital expenditure" in name:
+                has_capex = True
+            if "shares" in name and "outstanding" in name:
+                has_shares = True
+
         # Check for revenue series (critical)
-        revenue_series = next(
-            (m for m in financial_summary.metrics if m.metric_name.lower() == "revenue"),
-            None,
-        )
+        revenue_series = financial_summary.get("revenue")
         if not revenue_series or not revenue_series.values:
             raise ValueError(
                 "Financials failed: Revenue series missing or empty. "
@@ -73,19 +79,6 @@ class Pipeline:
             )
 
         # Check for at least one of: operating income, CFO, capex
-        has_operating_income = any(
-            "operating" in m.metric_name.lower() and "income" in m.metric_name.lower()
-            for m in financial_summary.metrics
-        )
-        has_cfo = any(
-            "cfo" in m.metric_name.lower() or "cash flow" in m.metric_name.lower()
-            for m in financial_summary.metrics
-        )
-        has_capex = any(
-            "capex" in m.metric_name.lower() or "capital expenditure" in m.metric_name.lower()
-            for m in financial_summary.metrics
-        )
-
         if not (has_operating_income or has_cfo or has_capex):
             raise ValueError(
                 "Financials failed: Missing required metrics. "
@@ -93,10 +86,6 @@ class Pipeline:
             )
 
         # Check for shares outstanding (required for per-share valuation)
-        has_shares = any(
-            "shares" in m.metric_name.lower() and "outstanding" in m.metric_name.lower()
-            for m in financial_summary.metrics
-        )
         if not has_shares:
             self.logger.warning(
                 "Shares outstanding not found. Valuation will use estimated value."
@@ -125,11 +114,26 @@ class Pipeline:
 
     def execute(self) -> None:
         """Execute the full analysis pipeline."""
+        # Logging is set up and torn down around each run, so a repeated execute()
+        # gets a live listener and nothing is queued once the run is over
+        self.logger = setup_logging(run_dir=self.run_context.run_dir)
+        try:
+            self._execute()
+        finally:
+            # Drain the log queue so the run's log file is complete when execute returns
+            stop_logging()
+
+    def _execute(self) -> None:
+        """Run the pipeline steps (logging is managed by execute)."""
         import time
         from datetime import datetime
 
+        # Agents, the Excel exporter and the pricing tool pull in heavy dependencies
+        # (yfinance, openpyxl, HTTP clients), so they are imported at the step that
+        # uses them; importing Pipeline stays cheap.
+
         start_time = time.time()
-        self.logger.info(f"Starting analysis for {self.run_context.ticker}")
+        self.logger.info("Starting analysis for %s", self.run_context.ticker)
 
         # Create run directory
         create_run_directory(self.run_context)
@@ -137,60 +141,82 @@ class Pipeline:
         # Fetch quote data early (for manifest and Excel)
         quote_data = None
         try:
-            self.logger.info(f"Fetching quote data for {self.run_context.ticker}")
+            self.logger.info("Fetching quote data for %s", self.run_context.ticker)
+            from mcp_analyst.tools.pricing import fetch_quote
             quote_data = fetch_quote(self.run_context.ticker)
             self.logger.info(
-                f"Quote data: price={quote_data.price}, market_cap={quote_data.market_cap}, "
-                f"beta={quote_data.beta}"
+                "Quote data: price=%s, market_cap=%s, beta=%s",
+                quote_data.price, quote_data.market_cap, quote_data.beta,
             )
         except Exception as e:
-            self.logger.warning(f"Failed to fetch quote data: {e}")
+            self.logger.warning("Failed to fetch quote data: %s", e)
 
+        # Excel export only needs step 1-3 outputs, so it runs on a worker thread
+        # while the skeptic and synthesizer steps continue on this one.
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel-export")
         try:
             # Step 1: Retrieve data
             step_start = time.time()
             self.logger.info("Step 1: Retrieving data sources")
+            from mcp_analyst.agents.retriever import RetrieverAgent
             retriever = RetrieverAgent(self.run_context)
             factpack = retriever.retrieve()
             self._validate_retriever(factpack)
-            self.logger.info(f"Step 1 complete: {len(factpack.sources)} sources, {len(factpack.facts)} facts")
+            self.logger.info(
+                "Step 1 complete: %d sources, %d facts", len(factpack.sources), len(factpack.facts)
+            )
 
             # Step 2: Normalize financials
             step_start = time.time()
             self.logger.info("Step 2: Normalizing financial metrics")
+            from mcp_analyst.agents.financials import FinancialsAgent
             financials_agent = FinancialsAgent(self.run_context)
             financial_summary = financials_agent.analyze(factpack)
             self._validate_financials(financial_summary)
-            self.logger.info(f"Step 2 complete: {len(financial_summary.periods)} periods, {len(financial_summary.metrics)} metrics")
+            self.logger.info(
+                "Step 2 complete: %d periods, %d metrics",
+                len(financial_summary.periods), len(financial_summary.metrics),
+            )
 
             # Step 3: Generate valuation
             step_start = time.time()
             self.logger.info("Step 3: Generating DCF valuation")
+            from mcp_analyst.agents.valuation import ValuationAgent
             valuation_agent = ValuationAgent(self.run_context)
             valuation_output = valuation_agent.valuate(financial_summary, factpack)
             self._validate_valuation(valuation_output)
             self.logger.info("Step 3 complete: DCF valuation generated")
 
+            # Step 6: Export Excel (in the background, collected before step 7; it is
+            # logged at collection so the run log keeps step order)
+            from mcp_analyst.exports.excel_dcf import export_dcf_to_excel
+            excel_future = pool.submit(
+                export_dcf_to_excel,
+                valuation_output,
+                self.run_context,
+                financial_summary=financial_summary,
+                quote_data=quote_data,
+                factpack=factpack,
+            )
+
             # Step 4: Skeptic validation
             step_start = time.time()
             self.logger.info("Step 4: Running skeptic validation")
+            from mcp_analyst.agents.skeptic import SkepticAgent
             skeptic_agent = SkepticAgent(self.run_context)
             skeptic_report = skeptic_agent.validate(factpack, valuation_output)
 
             # Step 5: Synthesize memo
             step_start = time.time()
             self.logger.info("Step 5: Synthesizing research memo")
+            from mcp_analyst.agents.synthesizer import SynthesizerAgent
             synthesizer = SynthesizerAgent(self.run_context)
             memo = synthesizer.synthesize(
                 factpack, financial_summary, valuation_output, skeptic_report
             )
 
-            # Step 6: Export Excel
-            step_start = time.time()
             self.logger.info("Step 6: Exporting Excel workbook")
-            excel_path = export_dcf_to_excel(
-                valuation_output, self.run_context, financial_summary=financial_summary, quote_data=quote_data, factpack=factpack
-            )
+            excel_path = excel_future.result()
 
             # Step 7: Save all artifacts
             self.logger.info("Step 7: Saving artifacts")
@@ -205,10 +231,12 @@ class Pipeline:
                 quote_data=quote_data,
             )
 
-            self.logger.info(f"Analysis complete: {self.run_context.run_dir}")
+            self.logger.info("Analysis complete: %s", self.run_context.run_dir)
 
         except Exception as e:
-            self.logger.error(f"Pipeline failed: {str(e)}")
+            self.logger.error("Pipeline failed: %s", e)
             save_failed_run(self.run_context, str(e))
             raise
+        finally:
+            pool.shutdown(wait=True)
 
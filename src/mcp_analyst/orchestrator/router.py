@@ -1,9 +1,11 @@
 """Task routing across agents and tools."""
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from mcp_analyst.orchestrator.run_context import RunContext
 
+TaskHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
 
 class Router:
     """Routes tasks to appropriate agents/tools."""
@@ -11,6 +13,17 @@ class Router:
     def __init__(self, run_context: RunContext):
         """Initialize router with run context."""
         self.run_context = run_context
+        self._dispatch: Dict[str, TaskHandler] = {}
+
+    def register(self, task: str, handler: TaskHandler) -> None:
+        """
+        Register the handler for a task.
+
+        Args:
+            task: Task identifier (e.g., "retrieve", "analyze_financials")
+            handler: Callable taking task inputs and returning task outputs
+        """
+        self._dispatch[task] = handler
 
     def route(
         self,
@@ -27,7 +40,9 @@ class Router:
         Returns:
             Task outputs
         """
-        # TODO: Implement routing logic
-        # For v1, this is a simple pass-through
-        return inputs
+        handler = self._dispatch.get(task)
+        if handler is None:
+            # For v1, unregistered tasks are a simple pass-through
+            return inputs
+        return handler(inputs)
 
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -23,6 +24,7 @@ class RunContext:
     ):
         """Initialize run context."""
         self.run_id = run_id
+        self.short_id = run_id[:8]  # Used in directory names and memo footers
         self.ticker = ticker
         self.sector = sector
         self.horizon = horizon
@@ -32,11 +34,11 @@ class RunContext:
         self.output_dir = output_dir
         self.created_at = created_at
 
-    @property
+    @cached_property
     def run_dir(self) -> Path:
-        """Get run directory path."""
+        """Get run directory path (computed once; the inputs are fixed for the run)."""
         date_str = self.created_at.strftime("%Y-%m-%d")
-        dir_name = f"{date_str}_{self.ticker}_{self.run_id[:8]}"
+        dir_name = f"{date_str}_{self.ticker}_{self.short_id}"
         return self.output_dir / dir_name
 
     @classmethod
@@ -1,8 +1,9 @@
 """Financial metrics schemas."""
 
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class MetricSeries(BaseModel):
@@ -13,6 +14,17 @@ class MetricSeries(BaseModel):
     periods: List[str]  # e.g., ["2023-Q1", "2023-Q2", ...]
     unit: str = "USD"  # "USD", "percentage", "ratio", etc.
 
+    _name_lc: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Lowercase the metric name once for case-insensitive lookups."""
+        self._name_lc = self.metric_name.lower()
+
+    @property
+    def name_lc(self) -> str:
+        """Lowercased metric name (computed at construction)."""
+        return self._name_lc
+
 
 class FinancialSummary(BaseModel):
     """Normalized financial summary with annual, quarterly, and TTM series."""
@@ -25,3 +37,21 @@ class FinancialSummary(BaseModel):
     ttm_period: Optional[str] = None  # TTM period identifier
     metadata: Dict[str, Any] = {}
 
+    @cached_property
+    def metrics_by_name(self) -> Dict[str, MetricSeries]:
+        """Metric series keyed by lowercased name (built once; first series wins)."""
+        by_name: Dict[str, MetricSeries] = {}
+        for metric in self.metrics:
+            by_name.setdefault(metric.name_lc, metric)
+        return by_name
+
+    def get(self, name: str) -> Optional[MetricSeries]:
+        """Get a metric series by name (case-insensitive).
+
+        Args:
+            name: Metric name, e.g. "Revenue"
+
+        Returns:
+            Matching MetricSeries, or None if absent
+        """
+        return self.metrics_by_name.get(name.lower())
@@ -3,12 +3,14 @@
 from datetime import datetime
 from typing import Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RunManifest(BaseModel):
     """Manifest for a single analysis run."""
 
+    model_config = ConfigDict(frozen=True)
+
     run_id: str
     ticker: str
     sector: Optional[str] = None
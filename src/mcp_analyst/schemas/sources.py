@@ -3,12 +3,14 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class Citation(BaseModel):
     """Citation reference."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_id: str
     url: Optional[str] = None
     title: Optional[str] = None
@@ -36,3 +38,6 @@ class SourceItem(BaseModel):
     content: Optional[str] = None
     metadata: dict = Field(default_factory=dict)
 
+
+# Built once at import and reused for bulk validation/serialization of source lists
+SOURCE_ITEM_LIST_ADAPTER = TypeAdapter(List[SourceItem])
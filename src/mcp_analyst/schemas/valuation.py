@@ -1,8 +1,9 @@
 """DCF valuation schemas."""
 
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DcfAssumptions(BaseModel):
@@ -57,6 +58,8 @@ class DcfAssumptions(BaseModel):
 class OperatingForecast(BaseModel):
     """Operating forecast for a single year."""
 
+    model_config = ConfigDict(frozen=True)
+
     year: str
     revenue: float
     cogs_ex_da: float
@@ -77,6 +80,8 @@ class OperatingForecast(BaseModel):
 class DcfResults(BaseModel):
     """DCF calculation results."""
 
+    model_config = ConfigDict(frozen=True)
+
     fair_value_per_share: float
     total_enterprise_value: float
     equity_value: float
@@ -86,6 +91,11 @@ class DcfResults(BaseModel):
     operating_forecast: List[OperatingForecast] = []  # Year-by-year forecast
     sensitivity: Dict[str, Any] = {}  # Sensitivity analysis results
 
+    @cached_property
+    def total_pv_ufcf(self) -> float:
+        """Sum of PV of UFCF across the operating forecast (computed once)."""
+        return sum(f.pv_ufcf for f in self.operating_forecast)
+
 
 class SensitivitySpec(BaseModel):
     """Sensitivity analysis specification."""
@@ -1,18 +1,27 @@
 """Artifact save/load utilities."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from mcp_analyst.orchestrator.run_context import RunContext
 from mcp_analyst.schemas.factpack import FactPack
 from mcp_analyst.schemas.financials import FinancialSummary
 from mcp_analyst.schemas.manifest import RunManifest
 from mcp_analyst.schemas.skeptic import SkepticReport
+from mcp_analyst.schemas.sources import SOURCE_ITEM_LIST_ADAPTER
 from mcp_analyst.schemas.valuation import ValuationOutput
 from mcp_analyst.storage.hashing import compute_file_hash
 
 
+def _write_and_hash(filepath: Path, payload: bytes) -> str:
+    """Write an artifact file and return its SHA-256 hash."""
+    filepath.write_bytes(payload)
+    return compute_file_hash(filepath)
+
+
 def save_artifacts(
     run_context: RunContext,
     factpack: FactPack,
@@ -39,38 +48,33 @@ def save_artifacts(
     artifacts = {}
     hashes = {}
 
-    # Save JSON artifacts
+    # Save JSON artifacts (pydantic-core serializes models straight to JSON bytes)
     json_artifacts = {
-        "sources.json": factpack.sources,
-        "factpack.json": factpack,
-        "financials.json": financial_summary,
-        "dcf_assumptions.json": valuation_output.assumptions,
-        "dcf_results.json": valuation_output.results,
-        "skeptic_report.json": skeptic_report,
+        "sources.json": SOURCE_ITEM_LIST_ADAPTER.dump_json(factpack.sources, indent=2),
+        "factpack.json": to_json(factpack, indent=2),
+        "financials.json": to_json(financial_summary, indent=2),
+        "dcf_assumptions.json": to_json(valuation_output.assumptions, indent=2),
+        "dcf_results.json": to_json(valuation_output.results, indent=2),
+        "skeptic_report.json": to_json(skeptic_report, indent=2),
     }
 
-    for filename, data in json_artifacts.items():
-        filepath = run_dir / filename
-        with open(filepath, "w") as f:
-            json.dump(
-                data.model_dump() if hasattr(data, "model_dump") else data,
-                f,
-                indent=2,
-                default=str,
-            )
-        artifacts[filename] = str(filepath)
-        hashes[filename] = compute_file_hash(filepath)
-
-    # Save memo
-    memo_path = run_dir / "memo.md"
-    with open(memo_path, "w") as f:
-        f.write(memo)
-    artifacts["memo.md"] = str(memo_path)
-    hashes["memo.md"] = compute_file_hash(memo_path)
-
-    # Excel file
-    artifacts["dcf_excel"] = str(excel_path)
-    hashes["dcf_excel"] = compute_file_hash(excel_path)
+    # Write and hash the independent artifacts in parallel (file I/O and hashlib both
+    # release the GIL); the manifest below needs every hash, so it stays serial
+    payloads = {**json_artifacts, "memo.md": memo.encode("utf-8")}
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            filename: pool.submit(_write_and_hash, run_dir / filename, payload)
+            for filename, payload in payloads.items()
+        }
+        excel_hash = pool.submit(compute_file_hash, excel_path)
+
+        for filename, future in futures.items():
+            artifacts[filename] = str(run_dir / filename)
+            hashes[filename] = future.result()
+
+        # Excel file
+        artifacts["dcf_excel"] = str(excel_path)
+        hashes["dcf_excel"] = excel_hash.result()
 
     # Create and save manifest
     manifest = RunManifest(
@@ -85,12 +89,11 @@ def save_artifacts(
         completed_at=datetime.now(),
         artifacts=artifacts,
         artifact_hashes=hashes,
-        quote_data=quote_data.model_dump() if quote_data else None,
+        quote_data=quote_data.model_dump(mode="json") if quote_data else None,
     )
 
     manifest_path = run_dir / "run_manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest.model_dump(), f, indent=2, default=str)
+    manifest_path.write_bytes(to_json(manifest, indent=2))
 
 
 def save_failed_run(run_context: RunContext, error_message: str) -> None:
@@ -123,10 +126,9 @@ def save_failed_run(run_context: RunContext, error_message: str) -> None:
     )
 
     manifest_path = run_dir / "run_manifest.json"
-    manifest_dict = manifest.model_dump()
+    manifest_dict = manifest.model_dump(mode="json")
     manifest_dict["status"] = "failed"
     manifest_dict["failed_reason"] = error_message
 
-    with open(manifest_path, "w") as f:
-        json.dump(manifest_dict, f, indent=2, default=str)
+    manifest_path.write_bytes(to_json(manifest_dict, indent=2))
 
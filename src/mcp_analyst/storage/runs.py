@@ -1,9 +1,13 @@
 """Run directory management."""
 
 from pathlib import Path
+from typing import Set
 
 from mcp_analyst.orchestrator.run_context import RunContext
 
+# Run directories already created by this process (run_dir is fixed per context)
+_CREATED: Set[Path] = set()
+
 
 def create_run_directory(run_context: RunContext) -> Path:
     """
@@ -16,10 +20,14 @@ def create_run_directory(run_context: RunContext) -> Path:
         Path to created run directory
     """
     run_dir = run_context.run_dir
+    if run_dir in _CREATED:
+        return run_dir
+
     run_dir.mkdir(parents=True, exist_ok=True)
 
     # Create logs subdirectory
     (run_dir / "logs").mkdir(exist_ok=True)
 
+    _CREATED.add(run_dir)
     return run_dir
 
@@ -1,17 +1,31 @@
 """Request cache (disk-based)."""
 
+import contextlib
 import hashlib
-import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
+from pydantic_core import from_json, to_json
+
 from mcp_analyst.config import Config
 
+# Cache directory already created in this process (re-checked if Config.CACHE_DIR changes)
+_READY_DIR: Optional[Path] = None
+
+
+def _ensure_cache_dir() -> None:
+    """Create the cache directory once instead of on every cache operation."""
+    global _READY_DIR
+    if _READY_DIR != Config.CACHE_DIR:
+        Config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _READY_DIR = Config.CACHE_DIR
+
 
 def _get_cache_path(key: str) -> Path:
     """Get cache file path for a key."""
-    Config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    key_hash = hashlib.md5(key.encode()).hexdigest()
+    key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
     return Config.CACHE_DIR / f"{key_hash}.json"
 
 
@@ -30,8 +44,7 @@ def get_cached(key: str) -> Optional[Any]:
         return None
 
     try:
-        with open(cache_path, "r") as f:
-            return json.load(f)
+        return from_json(cache_path.read_bytes())
     except Exception:
         return None
 
@@ -44,10 +57,18 @@ def set_cached(key: str, value: Any) -> None:
         key: Cache key
         value: Value to cache (must be JSON-serializable)
     """
+    _ensure_cache_dir()
     cache_path = _get_cache_path(key)
+    # Write to a per-writer temp file and rename it into place, so a crash or a
+    # concurrent reader never sees a truncated entry
+    tmp_path = cache_path.with_name(
+        f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
     try:
-        with open(cache_path, "w") as f:
-            json.dump(value, f, indent=2)
+        tmp_path.write_bytes(to_json(value))  # Compact: caches are machine-read only
+        os.replace(tmp_path, cache_path)
     except Exception:
-        pass  # Fail silently on cache write errors
+        # Fail silently on cache write errors
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
 
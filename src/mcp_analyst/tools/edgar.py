@@ -1,13 +1,76 @@
 """SEC EDGAR filings fetch and caching."""
 
-import json
+import heapq
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+from pydantic_core import from_json
+
 from mcp_analyst.config import Config
-from mcp_analyst.schemas.sources import SourceItem
+from mcp_analyst.schemas.sources import SOURCE_ITEM_LIST_ADAPTER, SourceItem
 from mcp_analyst.tools.cache import get_cached, set_cached
 from mcp_analyst.tools.http import http_get
 
+_ANNUAL_FORMS = frozenset(("10-K", "10-Q"))
+_QUARTERS = frozenset(("Q1", "Q2", "Q3", "Q4"))
+
+
+def _end_date(entry: Dict) -> str:
+    """Sort key for companyfacts entries (ISO end date)."""
+    end: str = entry.get("end", "")
+    return end
+
+
+@lru_cache(maxsize=1)
+def _ticker_index() -> Dict[str, str]:
+    """
+    Build the ticker -> CIK index from SEC's company tickers file (once per process).
+
+    Returns:
+        Dict mapping upper-cased ticker to 10-digit zero-padded CIK
+    """
+    cache_key = "ticker_cik_index"
+    cached = get_cached(cache_key)
+    if cached:
+        return cached
+
+    # SEC company tickers JSON endpoint
+    url = "https://www.sec.gov/files/company_tickers.json"
+    response = http_get(url)
+    data = from_json(response.content)
+
+    # SEC returns a dict where values are the company data
+    # Structure: {0: {"cik_str": "0001318605", "ticker": "AAPL", "title": "Apple Inc."}, ...}
+    index: Dict[str, str] = {}
+    for entry in data.values():
+        if isinstance(entry, dict):
+            # First entry wins for a ticker, as with the former linear scan
+            index.setdefault(
+                str(entry.get("ticker", "")).upper(), str(entry.get("cik_str", "")).zfill(10)
+            )
+
+    set_cached(cache_key, index)
+    return index
+
+
+@lru_cache(maxsize=512)
+def _lookup_cik(ticker: str) -> str:
+    """
+    Resolve a ticker via the disk cache and ticker index, memoized per process.
+
+    Raises on a miss so that lru_cache never memoizes an unresolved ticker.
+    """
+    cache_key = f"ticker_cik_{ticker}"
+    cached = get_cached(cache_key)
+    if cached:
+        return str(cached)
+
+    cik = _ticker_index().get(ticker.upper())
+    if not cik:
+        raise LookupError(f"Ticker {ticker} not in SEC ticker index")
+    set_cached(cache_key, cik)
+    return cik
+
 
 def ticker_to_cik(ticker: str) -> Optional[str]:
     """
@@ -19,42 +82,19 @@ def ticker_to_cik(ticker: str) -> Optional[str]:
     Returns:
         CIK string (10 digits, zero-padded) or None
     """
-    cache_key = f"ticker_cik_{ticker}"
-    cached = get_cached(cache_key)
-    if cached:
-        return cached
-
     try:
-        # SEC company tickers JSON endpoint
-        url = "https://www.sec.gov/files/company_tickers.json"
-        response = http_get(url)
-        data = response.json()
-
-        # SEC returns a dict where values are the company data
-        # Structure: {0: {"cik_str": "0001318605", "ticker": "AAPL", "title": "Apple Inc."}, ...}
-        for entry in data.values():
-            if isinstance(entry, dict) and entry.get("ticker", "").upper() == ticker.upper():
-                cik = str(entry.get("cik_str", ""))
-                # Pad CIK to 10 digits
-                cik = cik.zfill(10)
-                set_cached(cache_key, cik)
-                return cik
-
-        return None
+        return _lookup_cik(ticker)
     except Exception as e:
         # Log error but don't fail
         return None
 
 
-def fetch_companyfacts(ticker: str) -> Optional[Dict]:
+@lru_cache(maxsize=64)
+def _load_companyfacts(ticker: str) -> Dict:
     """
-    Fetch SEC companyfacts JSON for a ticker.
+    Load companyfacts JSON from the disk cache or SEC, memoized per process.
 
-    Args:
-        ticker: Stock ticker symbol
-
-    Returns:
-        Companyfacts JSON data or None
+    Raises on failure so that lru_cache never memoizes a miss.
     """
     cache_key = f"companyfacts_{ticker}"
     cached = get_cached(cache_key)
@@ -63,14 +103,30 @@ def fetch_companyfacts(ticker: str) -> Optional[Dict]:
 
     cik = ticker_to_cik(ticker)
     if not cik:
-        return None
+        raise LookupError(f"No CIK found for {ticker}")
+
+    url = f"{Config.EDGAR_BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"
+    response = http_get(url)
+    data = from_json(response.content)
+    set_cached(cache_key, data)
+    return data
+
+
+def fetch_companyfacts(ticker: str) -> Optional[Dict]:
+    """
+    Fetch SEC companyfacts JSON for a ticker.
+
+    Repeated calls in the same process return the same dict object, so callers
+    must treat it as read-only.
 
+    Args:
+        ticker: Stock ticker symbol
+
+    Returns:
+        Companyfacts JSON data or None
+    """
     try:
-        url = f"{Config.EDGAR_BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"
-        response = http_get(url)
-        data = response.json()
-        set_cached(cache_key, data)
-        return data
+        return _load_companyfacts(ticker)
     except Exception:
         return None
 
@@ -93,7 +149,7 @@ def get_submissions(cik: str) -> Optional[Dict]:
     try:
         url = f"{Config.EDGAR_BASE_URL}/submissions/CIK{cik}.json"
         response = http_get(url)
-        data = response.json()
+        data = from_json(response.content)
 
         # Extract latest 10-K and 10-Q
         filings = data.get("filings", {}).get("recent", {})
@@ -106,13 +162,17 @@ def get_submissions(cik: str) -> Optional[Dict]:
         latest_10q = None
         latest_10q_date = None
 
+        # "recent" arrays are ordered newest-first, so the first match per form is
+        # the latest one and the scan can stop once both are found
         for i, form in enumerate(forms):
-            if form == "10-K" and (not latest_10k_date or filing_dates[i] > latest_10k_date):
+            if form == "10-K" and latest_10k is None:
                 latest_10k = accession_numbers[i]
                 latest_10k_date = filing_dates[i]
-            elif form == "10-Q" and (not latest_10q_date or filing_dates[i] > latest_10q_date):
+            elif form == "10-Q" and latest_10q is None:
                 latest_10q = accession_numbers[i]
                 latest_10q_date = filing_dates[i]
+            if latest_10k is not None and latest_10q is not None:
+                break
 
         result = {
             "cik": cik,
@@ -159,26 +219,23 @@ def extract_financial_metric(
             else:
                 return result
 
-        # Process all entries
+        # Bucket entries in a single pass, then keep only the most recent per period
+        # type (by end date) without sorting the full history; nlargest matches a
+        # stable reverse sort + slice
+        want_annual = period_type in ("annual", "both")
+        want_quarterly = period_type in ("quarterly", "both")
+        annual, quarterly = [], []
         for entry in units.get(unit, []):
             fp = entry.get("fp", "")
-            form = entry.get("form", "")
-
-            # Annual data (fp == "FY")
-            if (period_type in ["annual", "both"]) and fp == "FY" and form in ["10-K", "10-Q"]:
-                result["annual"].append(entry)
+            if want_annual and fp == "FY" and entry.get("form", "") in _ANNUAL_FORMS:
+                annual.append(entry)
+            elif want_quarterly and fp in _QUARTERS:
+                quarterly.append(entry)
 
-            # Quarterly data (fp in ["Q1", "Q2", "Q3", "Q4"])
-            elif (period_type in ["quarterly", "both"]) and fp in ["Q1", "Q2", "Q3", "Q4"]:
-                result["quarterly"].append(entry)
-
-        # Sort by end date (most recent first)
-        result["annual"].sort(key=lambda x: x.get("end", ""), reverse=True)
-        result["quarterly"].sort(key=lambda x: x.get("end", ""), reverse=True)
-
-        # Limit to reasonable number
-        result["annual"] = result["annual"][:10]
-        result["quarterly"] = result["quarterly"][:12]
+        if want_annual:
+            result["annual"] = heapq.nlargest(10, annual, key=_end_date)
+        if want_quarterly:
+            result["quarterly"] = heapq.nlargest(12, quarterly, key=_end_date)
 
         return result
     except Exception:
@@ -199,7 +256,7 @@ def fetch_filings(ticker: str) -> List[SourceItem]:
     cache_key = f"edgar_filings_{ticker}"
     cached = get_cached(cache_key)
     if cached:
-        return cached
+        return SOURCE_ITEM_LIST_ADAPTER.validate_python(cached)
 
     cik = ticker_to_cik(ticker)
     if not cik:
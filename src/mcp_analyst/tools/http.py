@@ -1,12 +1,35 @@
 """HTTP requests wrapper with retries, headers, and rate limiting."""
 
+import threading
 import time
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from mcp_analyst.config import Config
 
+# One pooled session per process so repeated SEC/API calls reuse keep-alive
+# connections instead of paying a TCP + TLS handshake per request.
+# Retries stay in http_get, so the adapter itself does not retry.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+# Rate limiting: requests are spaced REQUEST_DELAY_SECONDS apart across all threads
+_RATE_LOCK = threading.Lock()
+_next_request_at = 0.0
+
+
+def _wait_for_rate_limit() -> None:
+    """Sleep only as long as needed to keep the configured spacing between requests."""
+    global _next_request_at
+    with _RATE_LOCK:
+        now = time.monotonic()
+        wait = max(0.0, _next_request_at - now)
+        _next_request_at = now + wait + Config.REQUEST_DELAY_SECONDS
+    if wait:
+        time.sleep(wait)
+
 
 def http_get(
     url: str,
@@ -37,11 +60,11 @@ def http_get(
         default_headers.update(headers)
 
     # Rate limiting
-    time.sleep(Config.REQUEST_DELAY_SECONDS)
+    _wait_for_rate_limit()
 
     for attempt in range(max_retries + 1):
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 url,
                 headers=default_headers,
                 timeout=Config.REQUEST_TIMEOUT_SECONDS,
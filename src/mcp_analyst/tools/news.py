@@ -1,12 +1,181 @@
 """News search wrapper with Event Registry (newsapi.ai) integration."""
 
+import hashlib
 import os
-from datetime import datetime, timedelta
-from typing import List, Optional
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from mcp_analyst.config import Config
 from mcp_analyst.schemas.sources import SourceItem
 
+try:
+    from eventregistry import EventRegistry, QueryArticlesIter
+
+    _HAS_ER = True
+except ImportError:
+    _HAS_ER = False
+
+# Shared Event Registry client; its internal requests.Session keeps the HTTPS
+# connection alive across searches instead of re-handshaking per call
+_ER_CLIENT = None
+_ER_LOCK = threading.Lock()
+
+# Fallback for article dates that fromisoformat rejects: "YYYY-MM-DD" with an optional
+# "THH:MM:SS" / " HH:MM:SS" time, accepting unpadded fields (as strptime does)
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})(?:(?:T|\s+)(\d{1,2}):(\d{1,2}):(\d{1,2}))?", re.IGNORECASE
+)
+
+# Material event categories and their (lowercase) keywords, checked in order
+# against an article's title and description
+_MATERIAL_KEYWORDS = (
+    ("m_and_a", ("deal", "acquisition", "merger", "partnership", "joint venture", "takeover")),
+    (
+        "litigation",
+        ("lawsuit", "litigation", "regulatory", "sec", "investigation", "settlement", "fine"),
+    ),
+    ("guidance", ("guidance", "earnings", "forecast", "outlook", "revenue", "profit")),
+    ("macro", ("recession", "rates", "inflation", "economy", "fed", "interest")),
+)
+
+# Sorts undated articles last
+_MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _news_source_id(key: str) -> str:
+    """Stable source ID for an article (builtin hash() is salted per process)."""
+    return f"news_{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"
+
+
+def _get_event_registry():
+    """Return the shared EventRegistry client, creating it on first use."""
+    global _ER_CLIENT
+    if _ER_CLIENT is None:
+        with _ER_LOCK:
+            if _ER_CLIENT is None:
+                _ER_CLIENT = EventRegistry(apiKey=Config.NEWS_API_KEY)
+    return _ER_CLIENT
+
+
+def _date_sort_key(source: SourceItem) -> datetime:
+    """Sort key for articles; naive dates are read as UTC so they compare with aware ones."""
+    date = source.date
+    if date is None:
+        return _MIN_DATE
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+def _parse_date(published_at) -> Optional[datetime]:
+    """
+    Parse an Event Registry article date.
+
+    Args:
+        published_at: ISO-ish date string or Unix timestamp
+
+    Returns:
+        Parsed datetime or None
+    """
+    if not published_at:
+        return None
+    try:
+        # Event Registry returns dates in various formats
+        if isinstance(published_at, str):
+            # Try ISO format first
+            try:
+                return datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+            except ValueError:
+                pass
+            # Fall back to the date/time prefix
+            match = _DATE_RE.fullmatch(published_at[:19])
+            if match:
+                y, m, d, hh, mm, ss = match.groups()
+                try:
+                    return datetime(int(y), int(m), int(d), int(hh or 0), int(mm or 0), int(ss or 0))
+                except ValueError:
+                    return None
+        elif isinstance(published_at, (int, float)):
+            # Unix timestamp
+            return datetime.fromtimestamp(published_at)
+    except Exception:
+        pass
+    return None
+
+
+@lru_cache(maxsize=256)
+def _query_articles(query: str, from_date: str, limit: int) -> Tuple[SourceItem, ...]:
+    """
+    Run an Event Registry article query, memoized per process.
+
+    Errors propagate (and so are never memoized); search_news handles them.
+    """
+    # Reuse the Event Registry client (and its pooled connection)
+    er = _get_event_registry()
+
+    # Convert from_date to datetime for Event Registry
+    from_date_obj = datetime.strptime(from_date, "%Y-%m-%d")
+
+    # Create query for articles
+    # Event Registry uses keyword search
+    q = QueryArticlesIter(
+        keywords=query,
+        dateStart=from_date_obj,
+        dataType=["news", "blog"],  # Include both news and blog posts
+    )
+
+    sources = []
+    article_count = 0
+
+    # Execute query and get articles
+    for art in q.execQuery(er, sortBy="date", maxItems=limit):
+        if article_count >= limit:
+            break
+
+        # Extract article data - Event Registry returns dict-like objects
+        # Access as dict or attributes depending on format
+        if hasattr(art, 'get'):
+            # Dict-like access
+            title = art.get("title") or ""
+            url = art.get("url") or ""
+            published_at = art.get("date") or ""
+            description = (art.get("body") or "")[:500]
+            source_info = art.get("source") or {}
+            source_name = source_info.get("title", "") if isinstance(source_info, dict) else str(source_info)
+            sentiment = art.get("sentiment") or 0
+        else:
+            # Attribute access
+            title = getattr(art, "title", "") or ""
+            url = getattr(art, "url", "") or ""
+            published_at = getattr(art, "date", "") or ""
+            description = (getattr(art, "body", "") or "")[:500]
+            source_obj = getattr(art, "source", None)
+            source_name = getattr(source_obj, "title", "") if source_obj else ""
+            sentiment = getattr(art, "sentiment", 0) or 0
+
+        date_obj = _parse_date(published_at)
+
+        # Every field is built here with the right type, so skip pydantic validation
+        source = SourceItem.model_construct(
+            source_id=_news_source_id(url or title),
+            source_type="news",
+            ticker="",  # Will be set by caller
+            title=title,
+            url=url,
+            date=date_obj,
+            metadata={
+                "source": source_name,
+                "description": description,
+                "publishedAt": str(published_at) if published_at else "",
+                "sentiment": float(sentiment) if sentiment else 0,  # Event Registry provides sentiment
+            },
+        )
+        sources.append(source)
+        article_count += 1
+
+    return tuple(sources)
+
 
 def search_news(
     query: str, from_date: Optional[str] = None, limit: int = 20
@@ -14,6 +183,9 @@ def search_news(
     """
     Search news using Event Registry (newsapi.ai).
 
+    Identical searches within a process are served from memory; call
+    _query_articles.cache_clear() to reset.
+
     Args:
         query: Search query (keywords or company name)
         from_date: Start date (YYYY-MM-DD), defaults to 30 days ago
@@ -30,106 +202,20 @@ def search_news(
         # Default to 30 days ago
         from_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
 
-    try:
-        from eventregistry import EventRegistry, QueryArticlesIter
-
-        # Initialize Event Registry
-        er = EventRegistry(apiKey=Config.NEWS_API_KEY)
-
-        # Convert from_date to datetime for Event Registry
-        from_date_obj = datetime.strptime(from_date, "%Y-%m-%d")
-
-        # Create query for articles
-        # Event Registry uses keyword search
-        q = QueryArticlesIter(
-            keywords=query,
-            dateStart=from_date_obj,
-            dataType=["news", "blog"],  # Include both news and blog posts
-        )
-
-        sources = []
-        article_count = 0
-
-        # Execute query and get articles
-        try:
-            for art in q.execQuery(er, sortBy="date", maxItems=limit):
-                if article_count >= limit:
-                    break
-
-                # Extract article data - Event Registry returns dict-like objects
-                # Access as dict or attributes depending on format
-                if hasattr(art, 'get'):
-                    # Dict-like access
-                    title = art.get("title", "") or art.get("title", "")
-                    url = art.get("url", "") or art.get("url", "")
-                    published_at = art.get("date", "") or art.get("date", "")
-                    description = (art.get("body", "") or art.get("body", ""))[:500] if art.get("body") else ""
-                    source_info = art.get("source", {}) or {}
-                    source_name = source_info.get("title", "") if isinstance(source_info, dict) else str(source_info)
-                    sentiment = art.get("sentiment", 0) or art.get("sentiment", 0)
-                else:
-                    # Attribute access
-                    title = getattr(art, "title", "") or ""
-                    url = getattr(art, "url", "") or ""
-                    published_at = getattr(art, "date", "") or ""
-                    description = (getattr(art, "body", "") or "")[:500]
-                    source_obj = getattr(art, "source", None)
-                    source_name = getattr(source_obj, "title", "") if source_obj else ""
-                    sentiment = getattr(art, "sentiment", 0) or 0
-
-                # Parse date
-                date_obj = None
-                if published_at:
-                    try:
-                        # Event Registry returns dates in various formats
-                        if isinstance(published_at, str):
-                            # Try ISO format first
-                            try:
-                                date_obj = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-                            except ValueError:
-                                # Try other common formats
-                                for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
-                                    try:
-                                        date_obj = datetime.strptime(str(published_at)[:19], fmt)
-                                        break
-                                    except ValueError:
-                                        continue
-                        elif isinstance(published_at, (int, float)):
-                            # Unix timestamp
-                            date_obj = datetime.fromtimestamp(published_at)
-                    except Exception:
-                        date_obj = None
-
-                source = SourceItem(
-                    source_id=f"news_{hash(url) if url else hash(title)}",
-                    source_type="news",
-                    ticker="",  # Will be set by caller
-                    title=title,
-                    url=url,
-                    date=date_obj,
-                    metadata={
-                        "source": source_name,
-                        "description": description,
-                        "publishedAt": str(published_at) if published_at else "",
-                        "sentiment": float(sentiment) if sentiment else 0,  # Event Registry provides sentiment
-                    },
-                )
-                sources.append(source)
-                article_count += 1
-        except Exception as query_error:
-            print(f"Event Registry query error: {type(query_error).__name__}: {query_error}")
-            # Return empty list if query fails
-            return []
-
-        return sources
-    except ImportError:
+    if not _HAS_ER:
         print("Event Registry package not installed. Install with: pip install eventregistry")
         return []
+
+    try:
+        articles = _query_articles(query, from_date, limit)
     except Exception as e:
         # Log errors for debugging
         print(f"Event Registry error: {type(e).__name__}: {e}")
         return []
 
+    # Hand out copies: callers set .ticker on the returned items
+    return [source.model_copy() for source in articles]
+
 
 def fetch_news(ticker: str, company_name: Optional[str] = None) -> List[SourceItem]:
     """
@@ -153,37 +239,29 @@ def fetch_news(ticker: str, company_name: Optional[str] = None) -> List[SourceIt
     # Primary search: just the company name/ticker
     primary_sources = search_news(base_query, limit=30)
     
-    # Filter for material events by checking title/description for keywords
-    material_keywords = {
-        'm_and_a': ['deal', 'acquisition', 'merger', 'partnership', 'joint venture', 'takeover'],
-        'litigation': ['lawsuit', 'litigation', 'regulatory', 'sec', 'investigation', 'settlement', 'fine'],
-        'guidance': ['guidance', 'earnings', 'forecast', 'outlook', 'revenue', 'profit'],
-        'macro': ['recession', 'rates', 'inflation', 'economy', 'fed', 'interest'],
-    }
-    
+    # Small result sets are kept whole, material or not
+    fallback_ok = len(primary_sources) < 20
+
     for source in primary_sources:
         if source.url and source.url not in seen_urls:
             # Check if article contains material event keywords
-            title_lower = (source.title or "").lower()
-            desc_lower = (source.metadata.get("description", "") if source.metadata else "").lower()
-            text = f"{title_lower} {desc_lower}"
-            
+            description = source.metadata.get("description", "") if source.metadata else ""
+            text = f"{source.title or ''} {description}".lower()
+
             # Categorize by keywords
             category = "general"
-            for cat, keywords in material_keywords.items():
+            for cat, keywords in _MATERIAL_KEYWORDS:
                 if any(kw in text for kw in keywords):
                     category = cat
                     break
             
             # Only include if it's a material event or has high relevance
-            if category != "general" or len(primary_sources) < 20:
+            if category != "general" or fallback_ok:
                 source.ticker = ticker
                 all_sources.append(source)
                 seen_urls.add(source.url)
 
     # Sort by date (most recent first)
-    all_sources.sort(
-        key=lambda x: x.date if x.date else datetime.min, reverse=True
-    )
+    all_sources.sort(key=_date_sort_key, reverse=True)
 
     return all_sources[:20]  # Return top 20
@@ -1,11 +1,13 @@
 """Price and market cap fetch wrapper using Yahoo Finance."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, Optional
 
 import yfinance as yf
 
+from mcp_analyst.config import Config
 from mcp_analyst.schemas.pricing import QuoteData
 from mcp_analyst.tools.cache import get_cached, set_cached
 
@@ -22,11 +24,19 @@ def _get_cache_key(ticker: str) -> str:
     return f"quote_{_normalize_ticker(ticker)}"
 
 
+# Lookups that returned neither price nor market cap are cached for at most this long,
+# so a bad or delisted ticker is not re-fetched on every call but recovers quickly
+NEGATIVE_CACHE_TTL_SECONDS = 60
+
+
 def _is_cache_valid(cached_data: dict, ttl_seconds: int) -> bool:
-    """Check if cached data is still valid based on TTL."""
+    """Check if cached data is still valid based on TTL (capped for negative entries)."""
     if not cached_data or "as_of_utc" not in cached_data:
         return False
 
+    if cached_data.get("_negative"):
+        ttl_seconds = min(ttl_seconds, NEGATIVE_CACHE_TTL_SECONDS)
+
     try:
         cached_time = datetime.fromisoformat(cached_data["as_of_utc"])
         age_seconds = (datetime.now(timezone.utc) - cached_time).total_seconds()
@@ -35,6 +45,21 @@ def _is_cache_valid(cached_data: dict, ttl_seconds: int) -> bool:
         return False
 
 
+# In-process tier in front of the disk cache (cache key -> cached quote dict);
+# validity is still checked against the TTL on every read
+_QUOTE_MEMO: Dict[str, dict] = {}
+
+
+def _get_cached_quote(cache_key: str) -> Optional[dict]:
+    """Get a cached quote dict, checking memory before the disk cache."""
+    cached = _QUOTE_MEMO.get(cache_key)
+    if cached is None:
+        cached = get_cached(cache_key)
+        if cached:
+            _QUOTE_MEMO[cache_key] = cached
+    return cached
+
+
 def fetch_quote(ticker: str, ttl_seconds: int = 600) -> QuoteData:
     """
     Fetch quote data from Yahoo Finance with caching.
@@ -50,10 +75,14 @@ def fetch_quote(ticker: str, ttl_seconds: int = 600) -> QuoteData:
     cache_key = _get_cache_key(ticker)
 
     # Check cache
-    cached = get_cached(cache_key)
+    cached = _get_cached_quote(cache_key)
     if cached and _is_cache_valid(cached, ttl_seconds):
-        logger.debug(f"Using cached quote for {ticker}")
-        return QuoteData(**cached)
+        if cached.get("_negative"):
+            logger.debug(f"Using negative-cached quote for {ticker}")
+        else:
+            logger.debug(f"Using cached quote for {ticker}")
+        # Cached payloads were validated when first fetched, so skip re-validation
+        return QuoteData.model_construct(**cached)
 
     # Fetch from Yahoo Finance
     logger.info(f"Fetching quote for {ticker} from Yahoo Finance")
@@ -69,26 +98,33 @@ def fetch_quote(ticker: str, ttl_seconds: int = 600) -> QuoteData:
         # Try fast_info first (faster)
         try:
             fast_info = t.fast_info
-            if hasattr(fast_info, "last_price") and fast_info.last_price:
-                quote.price = float(fast_info.last_price)
-            elif hasattr(fast_info, "lastPrice") and fast_info.lastPrice:
-                quote.price = float(fast_info.lastPrice)
-
-            if hasattr(fast_info, "market_cap") and fast_info.market_cap:
-                quote.market_cap = float(fast_info.market_cap)
-            elif hasattr(fast_info, "marketCap") and fast_info.marketCap:
-                quote.market_cap = float(fast_info.marketCap)
-
-            if hasattr(fast_info, "shares") and fast_info.shares:
-                quote.shares_out = float(fast_info.shares)
-
-            if hasattr(fast_info, "currency") and fast_info.currency:
-                quote.currency = str(fast_info.currency)
+            price = getattr(fast_info, "last_price", None) or getattr(fast_info, "lastPrice", None)
+            if price:
+                quote.price = float(price)
+
+            market_cap = getattr(fast_info, "market_cap", None) or getattr(
+                fast_info, "marketCap", None
+            )
+            if market_cap:
+                quote.market_cap = float(market_cap)
+
+            shares = getattr(fast_info, "shares", None)
+            if shares:
+                quote.shares_out = float(shares)
+
+            currency = getattr(fast_info, "currency", None)
+            if currency:
+                quote.currency = str(currency)
         except Exception as e:
             logger.debug(f"fast_info failed for {ticker}: {e}, falling back to info")
 
-        # Fallback to info for missing fields
-        info = t.info
+        # Fallback to info for missing fields; t.info is a separate (slow) Yahoo
+        # request, so skip it when fast_info already filled everything we need
+        needs_info = any(
+            value is None
+            for value in (quote.price, quote.market_cap, quote.shares_out, quote.currency)
+        ) or (quote.beta is None and not Config.QUOTE_SKIP_BETA)
+        info = t.info if needs_info else None
         if info:
             if quote.price is None:
                 if "regularMarketPrice" in info and info["regularMarketPrice"]:
@@ -119,6 +155,9 @@ def fetch_quote(ticker: str, ttl_seconds: int = 600) -> QuoteData:
     # Cache the result
     try:
         cache_data = quote.model_dump()
+        if quote.price is None and quote.market_cap is None:
+            cache_data["_negative"] = True
+        _QUOTE_MEMO[cache_key] = cache_data
         set_cached(cache_key, cache_data)
     except Exception as e:
         logger.debug(f"Failed to cache quote for {ticker}: {e}")
@@ -126,6 +165,35 @@ def fetch_quote(ticker: str, ttl_seconds: int = 600) -> QuoteData:
     return quote
 
 
+def fetch_quotes(tickers: List[str], ttl_seconds: int = 600) -> Dict[str, QuoteData]:
+    """
+    Fetch quotes for several tickers, fetching cache misses concurrently.
+
+    Args:
+        tickers: Stock ticker symbols
+        ttl_seconds: Cache TTL in seconds (default: 600 = 10 minutes)
+
+    Returns:
+        Dict mapping normalized ticker to QuoteData
+    """
+    quotes: Dict[str, QuoteData] = {}
+    misses: List[str] = []
+    for ticker in dict.fromkeys(_normalize_ticker(t) for t in tickers):
+        cached = _get_cached_quote(_get_cache_key(ticker))
+        if cached and _is_cache_valid(cached, ttl_seconds):
+            quotes[ticker] = QuoteData.model_construct(**cached)
+        else:
+            misses.append(ticker)
+
+    # Each Yahoo lookup is network-bound, so overlap them instead of paying N round-trips
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(16, len(misses))) as pool:
+            fetched = pool.map(lambda t: fetch_quote(t, ttl_seconds), misses)
+            quotes.update(zip(misses, fetched))
+
+    return quotes
+
+
 def fetch_current_price(ticker: str) -> Optional[float]:
     """
     Fetch current stock price (backwards compatible).
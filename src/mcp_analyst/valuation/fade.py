@@ -38,18 +38,15 @@ def exp_fade(start: float, end: float, n: int, k: float = 0.5) -> List[float]:
     if n <= 1:
         return [start]
     
-    result = []
-    for i in range(n):
-        t = i / (n - 1) if n > 1 else 0
+    last = n - 1
+    if start > 0 and end > 0:
         # Exponential decay: start * (end/start)^(t^k)
-        if start > 0 and end > 0:
-            value = start * ((end / start) ** (t ** k))
-        else:
-            # Linear fallback if values are problematic
-            value = start + (end - start) * t
-        result.append(value)
-    
-    return result
+        ratio = end / start
+        return [start * (ratio ** ((i / last) ** k)) for i in range(n)]
+
+    # Linear fallback if values are problematic
+    delta = end - start
+    return [start + delta * (i / last) for i in range(n)]
 
 
 def piecewise_fade(start: float, mid: float, end: float, n: int, split: int = 2) -> List[float]:
@@ -87,6 +84,16 @@ def piecewise_fade(start: float, mid: float, end: float, n: int, split: int = 2)
     return result
 
 
+# Method name -> schedule builder taking (start, end, n, kwargs)
+_FADE_METHODS = {
+    "linear": lambda start, end, n, kwargs: linear_fade(start, end, n),
+    "exp": lambda start, end, n, kwargs: exp_fade(start, end, n, kwargs.get("k", 0.5)),
+    "piecewise": lambda start, end, n, kwargs: piecewise_fade(
+        start, kwargs.get("mid", (start + end) / 2), end, n, kwargs.get("split", 2)
+    ),
+}
+
+
 def get_fade_schedule(method: str, start: float, end: float, n: int, **kwargs) -> List[float]:
     """
     Get fade schedule based on method name.
@@ -101,16 +108,6 @@ def get_fade_schedule(method: str, start: float, end: float, n: int, **kwargs) -
     Returns:
         List of faded values
     """
-    if method == "linear":
-        return linear_fade(start, end, n)
-    elif method == "exp":
-        k = kwargs.get("k", 0.5)
-        return exp_fade(start, end, n, k)
-    elif method == "piecewise":
-        mid = kwargs.get("mid", (start + end) / 2)
-        split = kwargs.get("split", 2)
-        return piecewise_fade(start, mid, end, n, split)
-    else:
-        # Default to linear
-        return linear_fade(start, end, n)
+    # Unknown methods default to linear
+    return _FADE_METHODS.get(method, _FADE_METHODS["linear"])(start, end, n, kwargs)
 
@@ -2,16 +2,19 @@
 
 import json
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
 from unittest.mock import MagicMock
 
 import pytest
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill
 
-from mcp_analyst.exports.excel_dcf import export_dcf_to_excel
+from mcp_analyst.exports.excel_dcf import ValSumLayout, export_dcf_to_excel
 from mcp_analyst.exports.excel_styles import (
+    HEADER_STYLE_NAME,
     apply_currency_millions,
     apply_decimal,
+    apply_formats,
     apply_number,
     apply_percent,
 )
@@ -26,7 +29,7 @@ from mcp_analyst.schemas.valuation import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_valuation_output():
     """Create a sample valuation output for testing."""
     assumptions = DcfAssumptions(
@@ -55,9 +58,10 @@ def sample_valuation_output():
         fade_method="piecewise",
     )
 
+    # Independent rows (one per forecast year) so the session-shared fixture never aliases
     forecast = [
         OperatingForecast(
-            year="2025",
+            year=str(2025 + i),
             revenue=11_000_000_000,
             cogs_ex_da=7_150_000_000,
             sga=2_200_000_000,
@@ -73,7 +77,8 @@ def sample_valuation_output():
             discount_factor=0.909,
             pv_ufcf=499_091_000,
         )
-    ] * 5
+        for i in range(5)
+    ]
 
     results = DcfResults(
         operating_forecast=forecast,
@@ -89,13 +94,13 @@ def sample_valuation_output():
     return ValuationOutput(assumptions=assumptions, results=results)
 
 
-@pytest.fixture
-def sample_run_context(tmp_path):
-    """Create a sample run context."""
+@pytest.fixture(scope="session")
+def sample_run_context(tmp_path_factory):
+    """Create a sample run context (shared by the session, with its run directory created)."""
     from datetime import datetime
     import uuid
     
-    return RunContext(
+    run_context = RunContext(
         run_id=str(uuid.uuid4()),
         ticker="TEST",
         sector="technology",
@@ -103,12 +108,14 @@ def sample_run_context(tmp_path):
         risk="moderate",
         focus="valuation",
         terminal="gordon",
-        output_dir=tmp_path,
+        output_dir=tmp_path_factory.mktemp("dcf_fmt"),
         created_at=datetime.now(),
     )
+    run_context.run_dir.mkdir(parents=True, exist_ok=True)
+    return run_context
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_quote_data():
     """Create sample quote data."""
     return QuoteData(
@@ -123,33 +130,60 @@ def sample_quote_data():
     )
 
 
-def test_discount_factor_not_currency(sample_valuation_output, sample_run_context, sample_quote_data):
-    """Test that discount factor row is NOT formatted as currency."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
+@pytest.fixture(scope="session")
+def exported_excel_path(sample_valuation_output, sample_run_context, sample_quote_data):
+    """Export the sample valuation once per session."""
+    return export_dcf_to_excel(
         sample_valuation_output,
         sample_run_context,
         quote_data=sample_quote_data,
     )
 
-    wb = load_workbook(excel_path)
-    dcf_sheet = wb["DCF"]
 
-    # Find discount factor row
-    discount_row = None
-    for row_idx, row in enumerate(dcf_sheet.iter_rows(), 1):
-        if any(cell.value and "Discount Factor" in str(cell.value) for cell in row):
-            discount_row = row_idx
-            break
+@pytest.fixture(scope="session")
+def exported_workbook(exported_excel_path):
+    """Load the exported workbook once, in streaming read-only mode, for the format checks."""
+    wb = load_workbook(exported_excel_path, read_only=True, data_only=False)
+    yield wb
+    wb.close()
+
+
+class SheetIndex(NamedTuple):
+    """Rows of one exported sheet, scanned once."""
+
+    labels: Dict[str, Tuple[int, tuple]]  # lowercased row label -> (row index, row cells)
+    texts: List[Tuple[int, str]]  # (row index, str(value)) for every non-empty cell
 
-    assert discount_row is not None, "Discount Factor row not found"
+
+@pytest.fixture(scope="session")
+def sheet_index(exported_workbook):
+    """Index the DCF, ValSum and Inputs sheets with a single sweep over each."""
+    index = {}
+    for name in ("DCF", "ValSum", "Inputs"):
+        labels: Dict[str, Tuple[int, tuple]] = {}
+        texts: List[Tuple[int, str]] = []
+        for row_idx, row in enumerate(exported_workbook[name].iter_rows(), 1):
+            row_texts = [str(cell.value) for cell in row if cell.value]
+            texts.extend((row_idx, text) for text in row_texts)
+            # A row's label is its first text cell; the first row with a label wins
+            label = next(
+                (cell.value for cell in row if isinstance(cell.value, str) and cell.value), None
+            )
+            if label is not None:
+                labels.setdefault(label.lower(), (row_idx, row))
+        index[name] = SheetIndex(labels, texts)
+    return index
+
+
+def test_discount_factor_not_currency(sheet_index):
+    """Test that discount factor row is NOT formatted as currency."""
+    dcf_labels = sheet_index["DCF"].labels
+    assert "discount factor" in dcf_labels, "Discount Factor row not found"
+    _, discount_row = dcf_labels["discount factor"]
 
     # Check that discount factor cells are NOT currency format
     # Currency format typically contains $ or has specific number format
-    for col in range(2, 10):  # Check columns B through I
-        cell = dcf_sheet.cell(discount_row, col)
+    for cell in discount_row[1:9]:  # Check columns B through I
         if cell.value is not None:
             # Discount factor should be decimal format (0.000), not currency
             assert "$" not in str(cell.number_format), f"Discount factor at {cell.coordinate} should not be currency"
@@ -158,32 +192,14 @@ def test_discount_factor_not_currency(sample_valuation_output, sample_run_contex
                 f"Discount factor at {cell.coordinate} should be decimal format"
 
 
-def test_shares_outstanding_not_currency(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_shares_outstanding_not_currency(sheet_index):
     """Test that shares outstanding is NOT formatted as currency."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
-    dcf_sheet = wb["DCF"]
-
-    # Find shares outstanding row
-    shares_row = None
-    for row_idx, row in enumerate(dcf_sheet.iter_rows(), 1):
-        if any(cell.value and "Shares Outstanding" in str(cell.value) for cell in row):
-            shares_row = row_idx
-            break
-
-    assert shares_row is not None, "Shares Outstanding row not found"
+    dcf_labels = sheet_index["DCF"].labels
+    assert "shares outstanding (m)" in dcf_labels, "Shares Outstanding row not found"
+    _, shares_row = dcf_labels["shares outstanding (m)"]
 
     # Check that shares cells are NOT currency format
-    for col in range(2, 10):
-        cell = dcf_sheet.cell(shares_row, col)
+    for cell in shares_row[1:9]:
         if cell.value is not None:
             # Shares should be number format, not currency
             assert "$" not in str(cell.number_format), \
@@ -194,33 +210,14 @@ def test_shares_outstanding_not_currency(sample_valuation_output, sample_run_con
                 f"Shares at {cell.coordinate} should be number format, got {cell.number_format}"
 
 
-def test_currency_rows_have_currency_format(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_currency_rows_have_currency_format(sheet_index):
     """Test that currency rows (revenue, costs, etc.) have currency formatting."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
-    dcf_sheet = wb["DCF"]
-
-    # Find revenue row
-    revenue_row = None
-    for row_idx, row in enumerate(dcf_sheet.iter_rows(), 1):
-        if any(cell.value and "Revenue" in str(cell.value) and "Margin" not in str(cell.value) 
-               for cell in row):
-            revenue_row = row_idx
-            break
-
-    assert revenue_row is not None, "Revenue row not found"
+    dcf_labels = sheet_index["DCF"].labels
+    assert "revenue" in dcf_labels, "Revenue row not found"
+    _, revenue_row = dcf_labels["revenue"]
 
     # Check that revenue cells have currency format
-    for col in range(2, 7):  # Check forecast columns
-        cell = dcf_sheet.cell(revenue_row, col)
+    for cell in revenue_row[1:6]:  # Check forecast columns
         if cell.value is not None:
             # Should have currency format (contains $ or _($)
             assert "$" in str(cell.number_format) or "_($" in str(cell.number_format) or \
@@ -228,157 +225,59 @@ def test_currency_rows_have_currency_format(sample_valuation_output, sample_run_
                 f"Revenue at {cell.coordinate} should be currency format, got {cell.number_format}"
 
 
-def test_valsum_sheet_exists(sample_valuation_output, sample_run_context, sample_quote_data, tmp_path):
+def test_valsum_sheet_exists(exported_workbook):
     """Test that ValSum sheet exists."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
+    wb = exported_workbook
 
     assert "ValSum" in wb.sheetnames, "ValSum sheet should exist"
 
 
-def test_current_price_cell_is_numeric(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_current_price_cell_is_numeric(exported_workbook):
     """Test that current price cell in ValSum is numeric."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
+    valsum_sheet = exported_workbook["ValSum"]
 
-    wb = load_workbook(excel_path)
-    valsum_sheet = wb["ValSum"]
-
-    # Find current price cell
-    price_cell = None
-    for row in valsum_sheet.iter_rows():
-        for cell in row:
-            if cell.value and "Current Price" in str(cell.value):
-                # Next cell should be the price value
-                price_cell = valsum_sheet.cell(cell.row, cell.column + 1)
-                break
-        if price_cell:
-            break
-
-    assert price_cell is not None, "Current Price cell not found"
+    label_cell = valsum_sheet[ValSumLayout.CURRENT_PRICE_LABEL]
+    price_cell = valsum_sheet[ValSumLayout.CURRENT_PRICE_VALUE]
+    assert label_cell.value == "Current Price", "Current Price label moved; update ValSumLayout"
+    assert label_cell.row == price_cell.row, "ValSumLayout label and value must share a row"
     assert isinstance(price_cell.value, (int, float)), \
         f"Current price should be numeric, got {type(price_cell.value)}"
 
 
-def test_confidence_labels_in_inputs(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_confidence_labels_in_inputs(sheet_index):
     """Test that confidence labels appear in Inputs sheet."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
-    inputs_sheet = wb["Inputs"]
+    inputs_texts = sheet_index["Inputs"].texts
 
     # Check for confidence column header
-    has_confidence_header = False
-    for row in inputs_sheet.iter_rows(max_row=5):
-        for cell in row:
-            if cell.value and "Confidence" in str(cell.value):
-                has_confidence_header = True
-                break
-        if has_confidence_header:
-            break
-
+    has_confidence_header = any(
+        "Confidence" in text for row_idx, text in inputs_texts if row_idx <= 5
+    )
     assert has_confidence_header, "Confidence column header should exist"
 
     # Check for confidence values (HIGH, MED, LOW)
-    has_confidence_values = False
-    for row in inputs_sheet.iter_rows():
-        for cell in row:
-            if cell.value in ["HIGH", "MED", "LOW"]:
-                has_confidence_values = True
-                break
-        if has_confidence_values:
-            break
-
+    has_confidence_values = any(text in ("HIGH", "MED", "LOW") for _, text in inputs_texts)
     assert has_confidence_values, "Confidence values (HIGH/MED/LOW) should exist"
 
 
-def test_overview_block_in_dcf(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_overview_block_in_dcf(sheet_index):
     """Test that Overview block exists in DCF sheet."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
-    dcf_sheet = wb["DCF"]
-
     # Check for Overview block
-    has_overview = False
-    for row in dcf_sheet.iter_rows(max_row=30):
-        for cell in row:
-            if cell.value and "Overview" in str(cell.value):
-                has_overview = True
-                break
-        if has_overview:
-            break
-
+    has_overview = any(
+        "Overview" in text for row_idx, text in sheet_index["DCF"].texts if row_idx <= 30
+    )
     assert has_overview, "Overview block should exist in DCF sheet"
 
 
-def test_fade_method_displayed(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_fade_method_displayed(sheet_index):
     """Test that fade method is displayed in Inputs sheet."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
-    inputs_sheet = wb["Inputs"]
-
     # Check for fade method
-    has_fade_method = False
-    for row in inputs_sheet.iter_rows():
-        for cell in row:
-            if cell.value and "piecewise" in str(cell.value).lower():
-                has_fade_method = True
-                break
-        if has_fade_method:
-            break
-
+    has_fade_method = any("piecewise" in text.lower() for _, text in sheet_index["Inputs"].texts)
     assert has_fade_method, "Fade method should be displayed in Inputs sheet"
 
 
-def test_column_letters_work_past_z(sample_valuation_output, sample_run_context, sample_quote_data):
+def test_column_letters_work_past_z(exported_workbook):
     """Test that column letters work correctly past column Z (AA, AB, etc.)."""
-    # Ensure run directory exists
-    sample_run_context.run_dir.mkdir(parents=True, exist_ok=True)
-    
-    excel_path = export_dcf_to_excel(
-        sample_valuation_output,
-        sample_run_context,
-        quote_data=sample_quote_data,
-    )
-
-    wb = load_workbook(excel_path)
+    wb = exported_workbook
     dcf_sheet = wb["DCF"]
 
     # Check that we can access columns beyond Z
@@ -392,3 +291,41 @@ def test_column_letters_work_past_z(sample_valuation_output, sample_run_context,
     except Exception as e:
         pytest.fail(f"Failed to access column AA: {e}")
 
+
+def test_export_to_stream(sample_valuation_output, sample_run_context, sample_quote_data):
+    """Test that the workbook can be written to a binary stream instead of a file."""
+    from io import BytesIO
+
+    buffer = BytesIO()
+    result = export_dcf_to_excel(
+        sample_valuation_output,
+        sample_run_context,
+        quote_data=sample_quote_data,
+        out=buffer,
+    )
+
+    assert result is None
+    buffer.seek(0)
+    wb = load_workbook(buffer)
+    assert "DCF" in wb.sheetnames
+
+
+def test_header_cells_use_named_style(exported_excel_path):
+    """Test that header cells reference the registered named style."""
+    # Named styles are only resolved on cells in the editable (non read-only) model
+    wb = load_workbook(exported_excel_path)
+    assert HEADER_STYLE_NAME in wb.named_styles
+    assert wb["Cases"]["A1"].style == HEADER_STYLE_NAME
+    assert wb["Cases"]["A1"].font.bold
+
+
+def test_apply_formats_batch():
+    """Test that apply_formats applies each range's format in order."""
+    wb = Workbook()
+    ws = wb.active
+    apply_formats(ws, {"A1:B2": "currency_m", "B2": "pct", "C1": "decimal"})
+
+    assert ws["A1"].number_format == '$#,##0'
+    assert ws["B1"].number_format == '$#,##0'
+    assert ws["B2"].number_format == '0.0%'
+    assert ws["C1"].number_format == '0.000'
@@ -0,0 +1,50 @@
+"""Tests for logging setup and teardown."""
+
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+from mcp_analyst.logging import setup_logging, stop_logging
+from mcp_analyst.orchestrator.pipeline import Pipeline
+from mcp_analyst.orchestrator.run_context import RunContext
+
+
+def _queue_handlers(logger: logging.Logger):
+    return [h for h in logger.handlers if isinstance(h, QueueHandler)]
+
+
+def test_repeated_setup_reaches_log_file(tmp_path):
+    """Records from a second setup/stop cycle are written to that run's log file."""
+    for run in ("first", "second"):
+        run_dir = tmp_path / run
+        logger = setup_logging(run_dir=run_dir)
+        logger.info("record from %s run", run)
+        stop_logging()
+
+        # Nothing is left queueing into a stopped listener
+        assert _queue_handlers(logger) == []
+        assert f"record from {run} run" in (run_dir / "logs" / "pipeline.log").read_text()
+
+
+def test_execute_twice_logs_both_runs(tmp_path):
+    """Each execute() sets up its own listener and drains it on return."""
+    run_context = RunContext.create(
+        ticker="TEST",
+        sector="Technology",
+        horizon="5y",
+        risk="moderate",
+        focus="revenue-growth",
+        terminal="gordon",
+        output_dir=tmp_path,
+    )
+    pipeline = Pipeline(run_context=run_context)
+    log_file = run_context.run_dir / "logs" / "pipeline.log"
+
+    for run in (1, 2):
+        def fake_steps(self, run=run):
+            self.logger.info("run %d", run)
+
+        with patch.object(Pipeline, "_execute", fake_steps):
+            pipeline.execute()
+        assert f"run {run}" in log_file.read_text()
+        assert _queue_handlers(pipeline.logger) == []
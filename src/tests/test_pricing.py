@@ -1,12 +1,26 @@
 """Tests for pricing module."""
 
 from datetime import datetime, timezone, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
 from mcp_analyst.schemas.pricing import QuoteData
-from mcp_analyst.tools.pricing import _is_cache_valid, _normalize_ticker, fetch_quote
+from mcp_analyst.tools.pricing import (
+    _QUOTE_MEMO,
+    _is_cache_valid,
+    _normalize_ticker,
+    fetch_quote,
+    fetch_quotes,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_quote_memo():
+    """Start every test with an empty in-process quote cache."""
+    _QUOTE_MEMO.clear()
+    yield
+    _QUOTE_MEMO.clear()
 
 
 def test_normalize_ticker():
@@ -31,6 +45,14 @@ def test_is_cache_valid():
     # Invalid cache (no timestamp)
     assert _is_cache_valid({}, ttl_seconds=600) is False
 
+    # Negative entries (no price or market cap) expire after the shorter negative TTL
+    recent_time = datetime.now(timezone.utc) - timedelta(seconds=100)
+    cached_data = {"as_of_utc": recent_time.isoformat(), "price": None, "_negative": True}
+    assert _is_cache_valid(cached_data, ttl_seconds=600) is False
+    assert _is_cache_valid(cached_data, ttl_seconds=30) is False
+    cached_data["as_of_utc"] = (datetime.now(timezone.utc) - timedelta(seconds=10)).isoformat()
+    assert _is_cache_valid(cached_data, ttl_seconds=600) is True
+
 
 @patch("mcp_analyst.tools.pricing.yf.Ticker")
 @patch("mcp_analyst.tools.pricing.get_cached")
@@ -112,3 +134,64 @@ def test_fetch_quote_handles_errors(mock_get_cached, mock_ticker):
     assert quote.as_of_utc is not None
     assert quote.source == "yahoo_finance"
 
+
+@patch("mcp_analyst.tools.pricing.fetch_quote")
+@patch("mcp_analyst.tools.pricing.get_cached")
+def test_fetch_quotes_only_fetches_misses(mock_get_cached, mock_fetch_quote):
+    """Test that fetch_quotes serves cache hits and fetches only the misses."""
+    cached_time = datetime.now(timezone.utc) - timedelta(seconds=100)
+    cached_quote = {"ticker": "UBER", "price": 80.0, "as_of_utc": cached_time.isoformat()}
+    mock_get_cached.side_effect = lambda key: cached_quote if key == "quote_UBER" else None
+    mock_fetch_quote.side_effect = lambda ticker, ttl_seconds: QuoteData(
+        ticker=ticker, price=150.0, as_of_utc=cached_time.isoformat()
+    )
+
+    quotes = fetch_quotes(["uber", "AAPL", " aapl "], ttl_seconds=600)
+
+    assert list(quotes) == ["UBER", "AAPL"]
+    assert quotes["UBER"].price == 80.0
+    assert quotes["AAPL"].price == 150.0
+    mock_fetch_quote.assert_called_once_with("AAPL", 600)
+
+
+@patch("mcp_analyst.tools.pricing.yf.Ticker")
+@patch("mcp_analyst.tools.pricing.get_cached")
+@patch("mcp_analyst.tools.pricing.set_cached")
+def test_fetch_quote_memoizes_in_process(mock_set_cached, mock_get_cached, mock_ticker):
+    """Test that repeated fetch_quote calls are served from memory."""
+    mock_get_cached.return_value = None
+    mock_ticker.side_effect = Exception("Network error")
+
+    first = fetch_quote("UBER", ttl_seconds=600)
+    second = fetch_quote("uber", ttl_seconds=600)
+
+    assert second == first
+    assert second is not first
+    mock_ticker.assert_called_once_with("UBER")
+    mock_get_cached.assert_called_once()
+
+
+@patch("mcp_analyst.tools.pricing.Config.QUOTE_SKIP_BETA", True)
+@patch("mcp_analyst.tools.pricing.yf.Ticker")
+@patch("mcp_analyst.tools.pricing.get_cached")
+@patch("mcp_analyst.tools.pricing.set_cached")
+def test_fetch_quote_skips_info_when_fast_info_complete(
+    mock_set_cached, mock_get_cached, mock_ticker
+):
+    """Test that t.info is not requested when fast_info filled every needed field."""
+    mock_get_cached.return_value = None
+
+    mock_ticker_obj = MagicMock()
+    mock_ticker_obj.fast_info = MagicMock(
+        last_price=81.5, market_cap=170000000000.0, shares=2000000000.0, currency="USD"
+    )
+    mock_info = PropertyMock(return_value={"beta": 1.19})
+    type(mock_ticker_obj).info = mock_info
+    mock_ticker.return_value = mock_ticker_obj
+
+    quote = fetch_quote("UBER", ttl_seconds=600)
+
+    assert quote.price == 81.5
+    assert quote.shares_out == 2000000000.0
+    assert quote.beta is None
+    mock_info.assert_not_called()
@@ -3,7 +3,7 @@
 import pytest
 
 from mcp_analyst.schemas.factpack import FactPack
-from mcp_analyst.schemas.financials import FinancialSummary
+from mcp_analyst.schemas.financials import FinancialSummary, MetricSeries
 from mcp_analyst.schemas.valuation import DcfAssumptions, DcfResults, ValuationOutput
 from mcp_analyst.schemas.skeptic import SkepticReport
 
@@ -23,6 +23,14 @@ def test_financial_summary_schema():
     assert isinstance(summary.metrics, list)
 
 
+def test_financial_summary_get_metric():
+    """Test case-insensitive metric lookup on FinancialSummary."""
+    revenue = MetricSeries(metric_name="Revenue", values=[100.0], periods=["2024"])
+    summary = FinancialSummary(ticker="UBER", metrics=[revenue])
+    assert summary.get("revenue") is revenue
+    assert summary.get("Operating Income") is None
+
+
 def test_dcf_assumptions_schema():
     """Test DcfAssumptions schema validation."""
     assumptions = DcfAssumptions(